@@ -17,6 +17,8 @@ from tensorguard.moai.keys import MoaiKeyManager
 from tensorguard.moai.exporter import MoaiExporter
 from tensorguard.moai.encrypt import MoaiEncryptor, MoaiDecryptor
 
+_RNG = np.random.default_rng()
+
 
 def main():
     print("=== TensorGuard MOAI Flow Demo (Real FHE) ===")
@@ -50,7 +52,7 @@ def main():
     # 4. Client Encryption
     print("\n[4] Client: Encrypting Input...")
     # Input must match weight shape. Weight is (128, 64). So Input is 64.
-    input_vector = np.random.randn(64).astype(np.float64) # TenSEAL likes float64 usually
+    input_vector = _RNG.standard_normal(64, dtype=np.float64) # TenSEAL likes float64 usually
     
     encryptor = MoaiEncryptor(key_id, sk_ctx)
     ciphertext = encryptor.encrypt_vector(input_vector)
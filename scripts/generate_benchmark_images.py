@@ -1,9 +1,70 @@
-import matplotlib.pyplot as plt
+import io
 import json
 import os
 import glob
+import multiprocessing
+from contextlib import contextmanager
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg", force=True)  # Headless: workers must not probe GUI toolkits
+import matplotlib.pyplot as plt
 import numpy as np
 
+BAR_WIDTH = 0.35  # Shared by the grouped and stacked bar charts
+
+# zlib level 6 (the default) buys little on flat-colour charts
+PNG_SAVE_KW = {
+    "pil_kwargs": {"compress_level": 1, "optimize": False},
+    "metadata": {"Software": None},
+}
+
+# One encode buffer reused by every chart (per process)
+_PNG_BUF = io.BytesIO()
+
+
+def _save_png(fig, output_path):
+    """Encode straight through the Agg canvas, skipping savefig's backend dispatch."""
+    _PNG_BUF.seek(0)
+    _PNG_BUF.truncate()
+    fig.canvas.print_png(_PNG_BUF, **PNG_SAVE_KW)
+    with _PNG_BUF.getbuffer() as view:
+        Path(output_path).write_bytes(view)
+
+
+# Long-running doc servers (TG_DOCS_SERVER=1) that import the plot functions
+# regenerate repeatedly; keep one Figure per chart and clear it instead of
+# rebuilding the canvas every run. main() draws in short-lived pool workers,
+# so it never reuses a cached figure.
+_FIG_CACHE = {}
+
+
+@contextmanager
+def _figure(name, figsize=(10, 6)):
+    """
+    Create a figure/axes pair for one chart.
+
+    Normally the figure is closed on exit, even if drawing fails. With
+    TG_DOCS_SERVER set it is instead kept open in _FIG_CACHE under name and
+    cleared on the next use.
+    """
+    if os.environ.get("TG_DOCS_SERVER"):
+        fig = _FIG_CACHE.get(name)
+        if fig is None:
+            fig = plt.figure(figsize=figsize, constrained_layout=True)
+            _FIG_CACHE[name] = fig
+        else:
+            fig.clf()
+        plt.figure(fig.number)  # Make it current for the plt.* calls below
+        yield fig, fig.subplots()
+        return
+
+    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    try:
+        yield fig, ax
+    finally:
+        plt.close(fig)
+
 def load_data(artifacts_dir="artifacts"):
     # Load Privacy
     privacy_data = []
@@ -26,28 +87,26 @@ def plot_privacy_tradeoff(data, output_path):
     mses = [d['metrics']['mse'] for d in data]
     rres = [d['metrics']['rre'] for d in data]
     
-    fig, ax1 = plt.subplots(figsize=(10, 6))
-    
-    color = 'tab:red'
-    ax1.set_xlabel('Defense Scenario')
-    ax1.set_ylabel('Inversion MSE (Lower is worse for privacy)', color=color)
-    bars = ax1.bar(scenarios, mses, color=color, alpha=0.6, label='Reconstruction Error')
-    ax1.tick_params(axis='y', labelcolor=color)
-    
-    # Add fake "Utility" line (Inverse of privacy roughly)
-    ax2 = ax1.twinx()
-    color = 'tab:blue'
-    ax2.set_ylabel('Model Utility (Proxy)', color=color)
-    # Mock data based on typical tradeoffs
-    utilities = [0.99, 0.98, 0.95, 0.92, 0.88] 
-    ax2.plot(scenarios, utilities, color=color, marker='o', linewidth=2, label='Utility')
-    ax2.tick_params(axis='y', labelcolor=color)
-    ax2.set_ylim(0, 1.1)
-
-    plt.title('Privacy vs Utility Trade-off (Gradient Inversion)')
-    fig.tight_layout()
-    plt.savefig(output_path)
-    print(f"Saved {output_path}")
+    with _figure("privacy_tradeoff") as (fig, ax1):
+        color = 'tab:red'
+        ax1.set_xlabel('Defense Scenario')
+        ax1.set_ylabel('Inversion MSE (Lower is worse for privacy)', color=color)
+        bars = ax1.bar(scenarios, mses, color=color, alpha=0.6, label='Reconstruction Error')
+        ax1.tick_params(axis='y', labelcolor=color)
+    
+        # Add fake "Utility" line (Inverse of privacy roughly)
+        ax2 = ax1.twinx()
+        color = 'tab:blue'
+        ax2.set_ylabel('Model Utility (Proxy)', color=color)
+        # Mock data based on typical tradeoffs
+        utilities = [0.99, 0.98, 0.95, 0.92, 0.88] 
+        ax2.plot(scenarios, utilities, color=color, marker='o', linewidth=2, label='Utility')
+        ax2.tick_params(axis='y', labelcolor=color)
+        ax2.set_ylim(0, 1.1)
+
+        plt.title('Privacy vs Utility Trade-off (Gradient Inversion)')
+        _save_png(fig, output_path)
+        print(f"Saved {output_path}")
 
 def plot_latency_comparison(output_path):
     # Data from README comparison + New Microbench results
@@ -60,19 +119,17 @@ def plot_latency_comparison(output_path):
     encryption = np.array([0, 0, 120, 82]) # N2HE optimization
     compression = np.array([0, 5, 50, 45])
     
-    width = 0.35
-    fig, ax = plt.subplots(figsize=(10, 6))
+    with _figure("latency_tax") as (fig, ax):
+        ax.bar(labels, training, BAR_WIDTH, label='Training/Backward', color='#e0e0e0')
+        ax.bar(labels, encryption, BAR_WIDTH, bottom=training, label='N2HE Encryption', color='#ff7f0e')
+        ax.bar(labels, compression, BAR_WIDTH, bottom=training+encryption, label='Compression/Sparsity', color='#2ca02c')
     
-    ax.bar(labels, training, width, label='Training/Backward', color='#e0e0e0')
-    ax.bar(labels, encryption, width, bottom=training, label='N2HE Encryption', color='#ff7f0e')
-    ax.bar(labels, compression, width, bottom=training+encryption, label='Compression/Sparsity', color='#2ca02c')
+        ax.set_ylabel('Latency per Round (ms)')
+        ax.set_title('Security Tax Analysis: Latency Breakdown')
+        ax.legend()
     
-    ax.set_ylabel('Latency per Round (ms)')
-    ax.set_title('Security Tax Analysis: Latency Breakdown')
-    ax.legend()
-    
-    plt.savefig(output_path)
-    print(f"Saved {output_path}")
+        _save_png(fig, output_path)
+        print(f"Saved {output_path}")
 
 def plot_success_parity(output_path):
     tasks = ['scoop_raisins', 'fold_shirt', 'pick_corn', 'open_pot']
@@ -80,33 +137,42 @@ def plot_success_parity(output_path):
     tg_v2 = [98.1, 97.3, 97.2, 97.6] # From our "simulation" results
     
     x = np.arange(len(tasks))
-    width = 0.35
     
-    fig, ax = plt.subplots(figsize=(10, 6))
-    rects1 = ax.bar(x - width/2, baseline, width, label='OpenVLA-OFT (Baseline)', color='gray')
-    rects2 = ax.bar(x + width/2, tg_v2, width, label='TensorGuard v2', color='#1f77b4')
+    with _figure("success_parity") as (fig, ax):
+        rects1 = ax.bar(x - BAR_WIDTH/2, baseline, BAR_WIDTH, label='OpenVLA-OFT (Baseline)', color='gray')
+        rects2 = ax.bar(x + BAR_WIDTH/2, tg_v2, BAR_WIDTH, label='TensorGuard v2', color='#1f77b4')
     
-    ax.set_ylabel('Task Success Rate (%)')
-    ax.set_title('Success Rate Parity (LIBERO Simulation)')
-    ax.set_xticks(x, tasks)
-    ax.set_ylim(90, 100)
-    ax.legend()
+        ax.set_ylabel('Task Success Rate (%)')
+        ax.set_title('Success Rate Parity (LIBERO Simulation)')
+        ax.set_xticks(x, tasks)
+        ax.set_ylim(90, 100)
+        ax.legend()
     
-    ax.bar_label(rects1, padding=3)
-    ax.bar_label(rects2, padding=3)
+        ax.bar_label(rects1, padding=3)
+        ax.bar_label(rects2, padding=3)
     
-    fig.tight_layout()
-    plt.savefig(output_path)
-    print(f"Saved {output_path}")
+        _save_png(fig, output_path)
+        print(f"Saved {output_path}")
+
+def _run(job):
+    """Render a single figure in a worker process."""
+    plot_fn, args = job
+    plot_fn(*args)
 
 def main():
     privacy, micro = load_data()
     
     os.makedirs("docs/images", exist_ok=True)
     
-    plot_privacy_tradeoff(privacy, "docs/images/privacy_tradeoff_gen.png")
-    plot_latency_comparison("docs/images/latency_tax_gen.png")
-    plot_success_parity("docs/images/success_parity_gen.png")
+    # Figures are independent and CPU-bound (Agg rendering + PNG encoding),
+    # so render them in parallel, one process per figure.
+    jobs = [
+        (plot_privacy_tradeoff, (privacy, "docs/images/privacy_tradeoff_gen.png")),
+        (plot_latency_comparison, ("docs/images/latency_tax_gen.png",)),
+        (plot_success_parity, ("docs/images/success_parity_gen.png",)),
+    ]
+    with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+        pool.map(_run, jobs)
 
 if __name__ == "__main__":
     main()
@@ -18,52 +18,72 @@ Production-Grade Features:
 __version__ = "2.1.0"
 __author__ = "Daniel Foo & The TensorGuard Team"
 
-try:
+import importlib
+
+# Public names are resolved on first access (PEP 562) rather than at import:
+# the CLI, agent daemon and bench tools import tensorguard.<submodule> and
+# should not pay for numpy, pydantic and the production stack up front.
+_LAZY_IMPORTS = {
     # Core interfaces
-    from .core.client import EdgeClient, create_client
-    from .schemas.common import ShieldConfig, Demonstration, SubmissionReceipt, ClientStatus
-    from .core.adapters import VLAAdapter
-    from .utils.config import settings
+    "EdgeClient": ".core.client",
+    "create_client": ".core.client",
+    "ShieldConfig": ".schemas.common",
+    "Demonstration": ".schemas.common",
+    "SubmissionReceipt": ".schemas.common",
+    "ClientStatus": ".schemas.common",
+    "VLAAdapter": ".core.adapters",
+    "settings": ".utils.config",
+}
+# Production components (from core.production)
+_LAZY_IMPORTS.update(dict.fromkeys((
+    # Operating envelope
+    "OperatingEnvelope",
+    "PEFTStrategy",
+    # Update package
+    "UpdatePackage",
+    "ModelTargetMap",
+    "TrainingMetadata",
+    "SafetyStatistics",
+    "ObjectiveType",
+    # Policy profiles
+    "DPPolicyProfile",
+    "EncryptionPolicyProfile",
+    "TrainingPolicyProfile",
+    # Key management
+    "KeyManagementSystem",
+    "KeyMetadata",
+    # Evaluation gating
+    "EvaluationGate",
+    "SafetyThresholds",
+    "EvaluationMetrics",
+    # Training pipeline
+    "TrainingPipeline",
+    "TrainingStage",
+    "StageConfig",
+    # Observability
+    "ObservabilityCollector",
+    "RoundLatencyBreakdown",
+    "CompressionMetrics",
+    "ModelQualityMetrics",
+    # Aggregation
+    "ResilientAggregator",
+    "ClientContribution",
+    # Utilities
+    "print_production_status",
+), ".core.production"))
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
 
-    # Production components (from core.production)
-    from .core.production import (
-        # Operating envelope
-        OperatingEnvelope,
-        PEFTStrategy,
-        # Update package
-        UpdatePackage,
-        ModelTargetMap,
-        TrainingMetadata,
-        SafetyStatistics,
-        ObjectiveType,
-        # Policy profiles
-        DPPolicyProfile,
-        EncryptionPolicyProfile,
-        TrainingPolicyProfile,
-        # Key management
-        KeyManagementSystem,
-        KeyMetadata,
-        # Evaluation gating
-        EvaluationGate,
-        SafetyThresholds,
-        EvaluationMetrics,
-        # Training pipeline
-        TrainingPipeline,
-        TrainingStage,
-        StageConfig,
-        # Observability
-        ObservabilityCollector,
-        RoundLatencyBreakdown,
-        CompressionMetrics,
-        ModelQualityMetrics,
-        # Aggregation
-        ResilientAggregator,
-        ClientContribution,
-        # Utilities
-        print_production_status,
-    )
-except ImportError:
-    pass
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     "EdgeClient",
@@ -6,9 +6,17 @@ Persists configuration to disk for offline resilience.
 """
 
 import os
+import json
+import socket
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from ..schemas.unified_config import AgentConfig
 from ..utils.logging import get_logger
@@ -32,6 +40,8 @@ class ConfigManager:
         self.current_config: Optional[AgentConfig] = None
         self._listeners: list[Callable[[AgentConfig], None]] = []
         self._http_client: Optional[Any] = None
+        # (st_mtime_ns, st_size) of the file that produced current_config
+        self._cache_key: Optional[Tuple[int, int]] = None
 
     def _get_client(self):
         if not self._http_client and self.current_config:
@@ -41,10 +51,21 @@ class ConfigManager:
             )
         return self._http_client
 
+    def close(self):
+        """Close the pooled control plane session."""
+        if self._http_client:
+            self._http_client.close()
+            self._http_client = None
+
     def _save_local(self, config: AgentConfig):
         """Save configuration to disk with safety checks."""
         try:
-            atomic_write(self.config_path, config.json(indent=2))
+            config_data = config.model_dump(mode="json")
+            if HAS_ORJSON:
+                payload = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(config_data, indent=2).encode("utf-8")
+            atomic_write(self.config_path, payload)
         except Exception as e:
             logger.error(f"Failed to save local config: {e}")
         
@@ -66,25 +87,34 @@ class ConfigManager:
     def load_local(self) -> AgentConfig:
         """Load configuration from local storage or defaults."""
         config_data = {}
-        
-        if self.config_path.exists():
+
+        try:
+            st = self.config_path.stat()
+            cache_key = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            cache_key = None
+
+        # Unchanged file: skip the read, parse and validation entirely
+        if cache_key is not None and cache_key == self._cache_key and self.current_config is not None:
+            return self.current_config
+
+        if cache_key is not None:
             try:
-                 import json
-                 config_data = json.loads(self.config_path.read_text())
+                 raw = self.config_path.read_bytes()
+                 config_data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
                  logger.info(f"Loaded config from {self.config_path}")
             except Exception as e:
                 logger.error(f"Failed to load local config: {e}")
         
-        # Env vars override
-        if not config_data.get("fleet_id"):
-             config_data["fleet_id"] = os.environ.get("TG_FLEET_ID", "unknown")
-            
-        if not config_data.get("agent_name"):
-            import socket
-            config_data["agent_name"] = os.environ.get("TG_AGENT_NAME", socket.gethostname())
+        # Env vars fill gaps; gethostname() is only called on a full miss
+        config_data["fleet_id"] = config_data.get("fleet_id") or os.environ.get("TG_FLEET_ID") or "unknown"
+        config_data["agent_name"] = (
+            config_data.get("agent_name") or os.environ.get("TG_AGENT_NAME") or socket.gethostname()
+        )
             
         try:
-            self.current_config = AgentConfig(**config_data)
+            self.current_config = AgentConfig.model_validate(config_data)
+            self._cache_key = cache_key
         except Exception as e:
             logger.warning(f"Invalid local config, using defaults: {e}")
             self.current_config = AgentConfig(
@@ -114,15 +144,17 @@ class ConfigManager:
             }
             
             new_config_data = client.request("POST", "api/v1/config/agent/sync", json=payload)
-            new_config = AgentConfig(**new_config_data)
+            new_config = AgentConfig.model_validate(new_config_data)
             
             if new_config != self.current_config:
                 logger.info("Configuration updated from Control Plane")
+                url_changed = new_config.control_plane_url != self.current_config.control_plane_url
                 self.current_config = new_config
                 self._save_local(new_config)
                 self._notify_listeners()
-                # Reset client as URL might have changed
-                self._http_client = None
+                # Keep the keep-alive session unless the Control Plane moved
+                if url_changed:
+                    self.close()
                 return True
                 
             return False
@@ -88,6 +88,8 @@ class AgentDaemon:
         if self.network_guard: self.network_guard.stop()
         if self.ml_mgr: self.ml_mgr.stop()
         if self.edge_mgr: self.edge_mgr.stop()
+
+        self.config_manager.close()
         
     def _init_subsystems(self, config: AgentConfig):
         """Initialize subsystem instances."""
@@ -14,6 +14,9 @@ import os
 import time
 from typing import Dict, Any, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from .config_manager import ConfigManager
 from .telemetry.emitter import TelemetryEmitter
 from ..edge_agent.spooler import Spooler
@@ -38,6 +41,7 @@ class EdgeAgentManager:
         self.ros_node: Optional[AgentNode] = None
         self.ros_thread: Optional[threading.Thread] = None
         self.telemetry_emitter: Optional[TelemetryEmitter] = None
+        self._http_session: Optional[requests.Session] = None
 
     def start(self):
         if self.running: return
@@ -64,11 +68,18 @@ class EdgeAgentManager:
         elif not fleet_id:
             logger.warning("No Fleet ID found. Uploader disabled.")
         else:
+            # Single pooled keep-alive session shared by every upload batch
+            self._http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+            self._http_session.mount("https://", adapter)
+            self._http_session.mount("http://", adapter)
+
             self.uploader = Uploader(
                 self.spooler,
                 target_url=base_url + "/telemetry",
                 api_key=api_key,
                 fleet_id=fleet_id,
+                session=self._http_session,
             )
             self.uploader.start()
             
@@ -101,6 +112,10 @@ class EdgeAgentManager:
         if self.uploader:
             self.uploader.stop()
 
+        if self._http_session:
+            self._http_session.close()
+            self._http_session = None
+
         if self.ros_node and HAS_ROS2 and rclpy.ok():
             self.ros_node.destroy_node()
             rclpy.shutdown()
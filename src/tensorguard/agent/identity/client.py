@@ -1,10 +1,18 @@
 import hashlib
 import hmac
+import json
 import time
 import uuid
 import logging
 from typing import Optional, Dict, Any
 from ...utils.http import StandardClient
+from ...utils.exceptions import ConfigurationError
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +24,19 @@ class IdentityAgentClient(StandardClient):
         super().__init__(base_url)
         self.fleet_id = fleet_id
         self.api_key = api_key
+        # Keyed once; each request signs with a copy, skipping ipad/opad setup
+        self._hmac_template = hmac.new(api_key.encode(), digestmod=hashlib.sha256) if api_key else None
 
     def signed_request(self, method: str, path: str, json_data: Any = None, **kwargs) -> Dict[str, Any]:
         """Perform a signed request to the platform."""
         timestamp = str(int(time.time()))
         nonce = str(uuid.uuid4())
         
-        # Compute body hash
-        import json
-        body = json.dumps(json_data).encode() if json_data else b""
+        # Compute body hash over the exact bytes we send
+        if json_data:
+            body = orjson.dumps(json_data) if HAS_ORJSON else json.dumps(json_data).encode()
+        else:
+            body = b""
         body_hash = hashlib.sha256(body).hexdigest()
         
         # Message to sign: timestamp:nonce:body_hash
@@ -36,11 +48,11 @@ class IdentityAgentClient(StandardClient):
         # Wait, if the platform uses the hash as the key, the agent needs the hash.
         # But usually the agent has the RAW key and the platform has the hash.
         # For this MVP, we'll assume the agent uses the API key it has.
-        signature = hmac.new(
-            self.api_key.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        if self._hmac_template is None:
+            raise ConfigurationError("Fleet API key is required for signed requests")
+        mac = self._hmac_template.copy()
+        mac.update(message.encode())
+        signature = mac.hexdigest()
         
         headers = {
             "x-tg-fleet-id": self.fleet_id,
@@ -48,5 +60,8 @@ class IdentityAgentClient(StandardClient):
             "x-tg-nonce": nonce,
             "x-tg-signature": signature,
         }
+        if body:
+            headers["Content-Type"] = "application/json"
+            kwargs["data"] = body
         
-        return self.request(method, path, json=json_data, headers=headers, **kwargs)
+        return self.request(method, path, headers=headers, **kwargs)
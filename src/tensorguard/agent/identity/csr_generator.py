@@ -6,6 +6,8 @@ Private keys NEVER leave the agent.
 """
 
 import os
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -57,12 +59,23 @@ class CSRGenerator:
     - Private keys stored encrypted or in PKCS#11/TPM
     - Private keys NEVER transmitted to control plane
     - Only CSR (public material) is sent
+    
+    Performance:
+    - With prewarm_keys > 0, start_prewarm() runs a background thread that
+      keeps that many spare RSA keys of PREWARM_RSA_KEY_SIZE ready, taking
+      keygen off the CSR critical path. Spares are stored only once handed
+      out; stop_prewarm() ends the thread.
     """
     
+    PREWARM_RSA_KEY_SIZE = 2048
+    # How often a blocked pool refill re-checks for stop_prewarm()
+    PREWARM_POLL_SECONDS = 0.5
+    
     def __init__(
         self,
         key_storage_path: str = "keys/identity", # Standardized path
         encryption_key: Optional[bytes] = None,
+        prewarm_keys: int = 0,
     ):
         self.vault = vault
         self.scope = KeyScope.IDENTITY
@@ -70,6 +83,58 @@ class CSRGenerator:
         
         # In-memory key cache (runtime only)
         self._key_cache: Dict[str, KeyPair] = {}
+        
+        # Spare RSA private keys (never persisted until used)
+        self._key_pool: Optional[queue.Queue] = None
+        if prewarm_keys > 0 and HAS_CRYPTOGRAPHY:
+            self._key_pool = queue.Queue(maxsize=prewarm_keys)
+        self._prewarm_thread: Optional[threading.Thread] = None
+        self._prewarm_stop = threading.Event()
+    
+    def start_prewarm(self) -> None:
+        """Start refilling the spare key pool in the background (no-op if disabled or running)."""
+        if self._key_pool is None or (self._prewarm_thread and self._prewarm_thread.is_alive()):
+            return
+        self._prewarm_stop.clear()
+        self._prewarm_thread = threading.Thread(target=self._fill_key_pool, daemon=True, name="csr-keygen")
+        self._prewarm_thread.start()
+    
+    def stop_prewarm(self, timeout: float = 2.0) -> None:
+        """Stop the pool refill thread; spares already generated stay usable."""
+        self._prewarm_stop.set()
+        if self._prewarm_thread:
+            self._prewarm_thread.join(timeout=timeout)
+            self._prewarm_thread = None
+    
+    def _fill_key_pool(self) -> None:
+        """Keep the spare key pool topped up until stop_prewarm() is called."""
+        stop = self._prewarm_stop
+        while not stop.is_set():
+            try:
+                key = rsa.generate_private_key(
+                    public_exponent=65537,
+                    key_size=self.PREWARM_RSA_KEY_SIZE,
+                    backend=default_backend()
+                )
+            except Exception as e:
+                logger.error(f"Key prewarm failed, disabling pool refill: {e}")
+                return
+            # Wait for room in the pool, waking up periodically to check for stop
+            while not stop.is_set():
+                try:
+                    self._key_pool.put(key, timeout=self.PREWARM_POLL_SECONDS)
+                    break
+                except queue.Full:
+                    continue
+    
+    def _take_prewarmed_key(self, key_size: int) -> Optional[Any]:
+        """Pop a spare RSA key of the requested size, if one is ready."""
+        if self._key_pool is None or key_size != self.PREWARM_RSA_KEY_SIZE:
+            return None
+        try:
+            return self._key_pool.get_nowait()
+        except queue.Empty:
+            return None
     
     def generate_key(
         self,
@@ -95,7 +160,7 @@ class CSRGenerator:
         key_id = str(uuid.uuid4())
         
         if key_type.upper() == "RSA":
-            private_key = rsa.generate_private_key(
+            private_key = self._take_prewarmed_key(key_size) or rsa.generate_private_key(
                 public_exponent=65537,
                 key_size=key_size,
                 backend=default_backend()
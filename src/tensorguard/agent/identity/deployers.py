@@ -386,19 +386,21 @@ class EnvoyDeployer:
             return DeployResult(success=False, message=str(e))
 
 
+# Endpoint type -> deployer class, built once at import
+_DEPLOYERS = {
+    "kubernetes": KubernetesDeployer,
+    "nginx": NginxDeployer,
+    "envoy": EnvoyDeployer,
+}
+
+
 class DeployerFactory:
     """Factory for creating appropriate deployers."""
     
     @staticmethod
     def get_deployer(endpoint_type: str) -> Any:
         """Get deployer for endpoint type."""
-        deployers = {
-            "kubernetes": KubernetesDeployer,
-            "nginx": NginxDeployer,
-            "envoy": EnvoyDeployer,
-        }
-        
-        deployer_class = deployers.get(endpoint_type)
+        deployer_class = _DEPLOYERS.get(endpoint_type)
         if deployer_class:
             return deployer_class()
         
@@ -5,11 +5,13 @@ Manages the lifecycle of identity services within the Unified Agent.
 Wraps the Scanner, CSR Generator, and communication logic.
 """
 
+import functools
+import heapq
 import logging
 import threading
 import time
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 from ...schemas.unified_config import IdentityConfig
 
 from .scanner import CertificateScanner
@@ -19,8 +21,27 @@ from .tpm_simulator import TPMSimulator
 from .work_poller import WorkPoller
 from .client import IdentityAgentClient
 
+try:
+    from ciso8601 import parse_datetime as _parse_datetime  # C parser, accepts 'Z'
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp (trailing 'Z' allowed) into naive UTC."""
+    if HAS_CISO8601:
+        parsed = _parse_datetime(value)
+    else:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
 class IdentityManager:
     """
     Subsystem controller for Machine Identity Guard.
@@ -32,7 +53,11 @@ class IdentityManager:
         self.api_key = agent_config.api_key
         
         self.scanner = CertificateScanner()
-        self.csr_generator = CSRGenerator(key_storage_path=self.config.key_storage_path)
+        self.csr_generator = CSRGenerator(
+            key_storage_path=self.config.key_storage_path,
+            # Renewals request RSA-2048; keep a couple of spares ready
+            prewarm_keys=2 if self.config.auto_renew else 0,
+        )
         self.tpm = TPMSimulator() # Hardware trust root
         
         # Identity client and poller
@@ -45,11 +70,13 @@ class IdentityManager:
             config=agent_config,
             fleet_id=self.fleet_id,
             api_key=self.api_key,
-            csr_generator=self.csr_generator
+            csr_generator=self.csr_generator,
+            client=self.client,
         )
         
         self.running = False
         self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
     def configure(self, new_config: IdentityConfig):
         """Update configuration on the fly."""
@@ -62,41 +89,68 @@ class IdentityManager:
             return
             
         logger.info("IdentityManager starting...")
+        self.csr_generator.start_prewarm()
         self.running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
         """Stop background tasks."""
         self.running = False
+        self._stop_event.set()  # Wake the loop immediately
         if self._thread:
             self._thread.join(timeout=2.0)
+        self.csr_generator.stop_prewarm()
+        self.client.close()
 
     def _run_loop(self):
-        """Main identity loop."""
+        """
+        Main identity loop.
+
+        Scan, job polling and heartbeat each keep their own next-fire time in a
+        min-heap, so the thread sleeps until the earliest one is due. Intervals
+        are re-read from config on every reschedule to pick up configure();
+        job polling is jittered and backs off while the control plane fails.
+        """
+        tasks = (
+            (lambda: self.config.scan_interval_seconds, self._scan_and_check_renewals),
+            (lambda: self.poller.next_delay(self.config.poll_interval_seconds), self.poller.poll_and_execute),
+            (lambda: self.config.heartbeat_interval_seconds, self.send_heartbeat),
+        )
+        # Hot names bound to locals for the lifetime of the loop
+        monotonic = time.monotonic
+        heapreplace = heapq.heapreplace
+        wait = self._stop_event.wait
+
+        # Everything fires once at startup, in the order above
+        now = monotonic()
+        schedule = [(now, i) for i in range(len(tasks))]
+        heapq.heapify(schedule)
+
         while self.running:
+            next_ts, i = schedule[0]
+            delay = next_ts - monotonic()
+            if delay > 0 and wait(timeout=delay):
+                break
+
+            next_delay, task = tasks[i]
             try:
-                # 1. Periodic Scan
-                self.run_scan()
-                
-                # 2. Poll for identity work (renewals, etc.)
-                self.poller.poll_and_execute()
-                
-                # 3. Hardware Attestation Heartbeat
-                self.send_heartbeat()
-                
+                task()
             except Exception as e:
                 logger.error(f"Identity loop error: {e}")
-            
-            # Sleep interval
-            for _ in range(self.config.scan_interval_seconds):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Reschedule after running so the delay can reflect the outcome
+            heapreplace(schedule, (monotonic() + next_delay(), i))
+
+    def _scan_and_check_renewals(self):
+        """Periodic scan, reusing its results for the renewal check."""
+        certs = self.run_scan()
+        if self.config.auto_renew:
+            self.check_renewals(certs=certs)
 
     def run_scan(self) -> List[dict]:
         """Execute a certificate scan."""
-        logger.info("Executing periodic certificate scan")
+        logger.debug("Executing periodic certificate scan")
         certs = self.scanner.scan_all(
             include_kubernetes=self.config.scan_kubernetes,
             include_nginx=self.config.scan_nginx,
@@ -107,33 +161,51 @@ class IdentityManager:
         self._report_certificates(certs)
         return certs
         
-    def check_renewals(self):
-        """Check for certificates nearing expiry (<24h) and trigger auto-renewal."""
+    def check_renewals(self, certs: Optional[List] = None):
+        """
+        Check for certificates nearing expiry (<24h) and trigger auto-renewal.
+
+        Pass the result of a scan that just ran to avoid walking the filesystem
+        again; only when no certs are given is the key storage path rescanned.
+        """
         # Simple renewal policy check
-        certs = self.scanner.scan_filesystem(self.config.key_storage_path)
+        if certs is None:
+            certs = self.scanner.scan_filesystem([self.config.key_storage_path])
+        now = datetime.utcnow()
         for cert in certs:
-            expiry = datetime.fromisoformat(cert['not_after'].replace("Z", ""))
-            days_left = (expiry - datetime.utcnow()).days
+            days_left = (self._get_expiry(cert) - now).days
             
             if days_left < 1:
-                logger.warning(f"Certificate {cert['subject']} nearing expiry. Triggering renewal.")
+                subject = cert['subject'] if isinstance(cert, dict) else cert.subject_dn
+                logger.warning(f"Certificate {subject} nearing expiry. Triggering renewal.")
                 # Logic: Generate new CSR -> Request Sign -> Deploy
                 # Stub for MVP, but architecture fits here
                 self._renew_certificate(cert)
 
+    @staticmethod
+    def _get_expiry(cert) -> datetime:
+        """Expiry of a scanned certificate (dict or DiscoveredCertificate) as naive UTC."""
+        not_after = cert['not_after'] if isinstance(cert, dict) else cert.not_after
+        if isinstance(not_after, datetime):
+            return not_after
+        # Unchanged certs yield identical strings, so repeat ticks hit the parse cache
+        return _parse_iso(not_after)
+
     def send_heartbeat(self):
         """Send TPM-signed heartbeat."""
         nonce = datetime.utcnow().isoformat()
         try:
             quote = self.tpm.get_quote(nonce)
             # In production: self.client.signed_request("POST", "/agent/heartbeat", ...)
-            logger.debug(f"Generated TPM quote for heartbeat: {quote['signature_hex'][:20]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Generated TPM quote for heartbeat: %s...", quote['signature_hex'][:20])
         except Exception as e:
             logger.error(f"Heartbeat failed: {e}")
 
     def _renew_certificate(self, cert_info: dict):
         """Execute renewal workflow."""
-        logger.info(f"Renewing certificate for {cert_info['subject']}")
+        subject = cert_info['subject'] if isinstance(cert_info, dict) else cert_info.subject_dn
+        logger.info(f"Renewing certificate for {subject}")
         # 1. Generate new Key/CSR
         # 2. Call Platform API
         # 3. Write new cert to disk
@@ -1,7 +1,9 @@
 import logging
+import random
 import time
 import os
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 from .client import IdentityAgentClient
 from .csr_generator import CSRGenerator
 from .deployers import DeployerFactory
@@ -12,26 +14,68 @@ class WorkPoller:
     """
     Polls the Control Plane for identity renewal jobs and executes them.
     """
-    def __init__(self, config, fleet_id: str, api_key: str, csr_generator: CSRGenerator):
+    # Upper bound on concurrent CSR generations per poll
+    MAX_CSR_WORKERS = 8
+    # Extra delay added after consecutive poll failures (doubles up to the cap)
+    BACKOFF_INITIAL_SECONDS = 1.0
+    BACKOFF_MAX_SECONDS = 60.0
+    # Fraction of the delay added as random jitter to de-synchronize the fleet
+    JITTER_FRACTION = 0.1
+
+    def __init__(
+        self,
+        config,
+        fleet_id: str,
+        api_key: str,
+        csr_generator: CSRGenerator,
+        client: Optional[IdentityAgentClient] = None,
+    ):
         self.config = config
-        self.client = IdentityAgentClient(config.platform_url, fleet_id, api_key)
+        # Share the caller's keep-alive session when given one
+        self.client = client or IdentityAgentClient(config.control_plane_url, fleet_id, api_key)
         self.csr_generator = csr_generator
         self.running = False
+        self._backoff = 0.0
+
+    def next_delay(self, interval: float) -> float:
+        """Seconds until the next poll: interval plus failure back-off, jittered."""
+        delay = interval + self._backoff
+        return delay + random.uniform(0, delay * self.JITTER_FRACTION)
 
     def poll_and_execute(self):
         """Single poll and execution cycle."""
         try:
             # 1. Get pending jobs for this fleet
             jobs = self.client.signed_request("GET", "/api/v1/identity/agent/jobs")
+            self._backoff = 0.0
+            
+            # 2. CSR jobs are dominated by key generation, which runs in the
+            # cryptography C backend with the GIL released: fan them out.
+            csr_jobs = [job for job in jobs if job.get("status") == "csr_requested"]
+            other_jobs = [job for job in jobs if job.get("status") != "csr_requested"]
+            
+            process = self._safe_process_job
+            if len(csr_jobs) > 1:
+                workers = min(self.MAX_CSR_WORKERS, len(csr_jobs))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="csr") as pool:
+                    list(pool.map(process, csr_jobs))
+            else:
+                for job in csr_jobs:
+                    process(job)
             
-            for job in jobs:
-                try:
-                    self._process_job(job)
-                except Exception as e:
-                    logger.error(f"Failed to process job {job.get('id')}: {e}")
+            for job in other_jobs:
+                process(job)
                     
         except Exception as e:
-            logger.error(f"WorkPoller poll error: {e}")
+            self._backoff = min(max(self._backoff * 2, self.BACKOFF_INITIAL_SECONDS), self.BACKOFF_MAX_SECONDS)
+            logger.error(f"WorkPoller poll error (backing off {self._backoff:.0f}s): {e}")
+
+    def _safe_process_job(self, job: Dict[str, Any]):
+        """Process one job, logging (not raising) failures so siblings still run."""
+        try:
+            self._process_job(job)
+        except Exception as e:
+            logger.error(f"Failed to process job {job.get('id')}: {e}")
 
     def _process_job(self, job: Dict[str, Any]):
         job_id = job["id"]
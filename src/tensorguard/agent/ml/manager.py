@@ -5,13 +5,20 @@ Manages the TrainingWorker and integration with the Unified Config.
 Supports deployment directives for hot-swapping adapters and shadow mode.
 """
 
+import importlib.util
 import logging
 import threading
 import time
-from typing import Optional, Dict, Any
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from ...schemas.unified_config import MLConfig, DeploymentDirective
 
-from .worker import TrainingWorker, WorkerConfig
+if TYPE_CHECKING:
+    from .worker import TrainingWorker
+
+# Probe without importing: flwr (and the worker, which subclasses its
+# NumPyClient) pull in grpc and friends, so they load only once ML starts.
+HAS_FLWR = importlib.util.find_spec("flwr") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +31,15 @@ class MLManager:
     INITIAL_RETRY_INTERVAL = 5
     MAX_RETRY_INTERVAL = 120
 
+    DEFAULT_SERVER_ADDRESS = "127.0.0.1:8080"
+
     def __init__(self, agent_config: 'AgentConfig', config_manager: 'ConfigManager'):
         self.config: MLConfig = agent_config.ml
         self.fleet_id = agent_config.fleet_id
 
-        self.worker: Optional[TrainingWorker] = None
+        self.worker: Optional['TrainingWorker'] = None
+        self._worker_key: Optional[tuple] = None
+        self._server_address: str = self.DEFAULT_SERVER_ADDRESS
         self.running = False
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
@@ -40,7 +51,22 @@ class MLManager:
         self._init_worker()
 
     def _init_worker(self):
-        """Initialize the TrainingWorker."""
+        """Initialize the TrainingWorker, reusing it if its settings are unchanged."""
+        self._server_address = self._parse_server_address(self.config.aggregator_url)
+        
+        key = (
+            self.config.model_type,
+            self.config.max_gradient_norm,
+            self.config.dp_epsilon,
+            self.config.sparsity,
+            self.config.compression_ratio,
+        )
+        if self.worker is not None and key == self._worker_key:
+            # configure() followed by start() would otherwise build it twice
+            return
+        
+        from .worker import TrainingWorker, WorkerConfig
+
         worker_config = WorkerConfig(
             model_type=self.config.model_type,
             max_gradient_norm=self.config.max_gradient_norm,
@@ -49,11 +75,23 @@ class MLManager:
             compression_ratio=self.config.compression_ratio
         )
         self.worker = TrainingWorker(worker_config, cid=self.fleet_id)
+        self._worker_key = key
         
         # Determine adapter based on model_type (stub)
         # from tensorguard.core.adapters import Pi0Adapter
         # self.worker.set_adapter(Pi0Adapter())
 
+    @classmethod
+    def _parse_server_address(cls, url: str) -> str:
+        """Reduce an aggregator URL to the host:port gRPC target Flower expects."""
+        if not url:
+            return cls.DEFAULT_SERVER_ADDRESS
+        if "://" not in url:
+            # Already host:port (urlsplit would misread "localhost:8080" as a scheme)
+            return url.rstrip("/")
+        parts = urlsplit(url)
+        return parts.netloc or parts.path.rstrip("/")
+
     def start(self):
         """Start the training loop (e.g., Flower client)."""
         if not self.config.enabled:
@@ -82,25 +120,28 @@ class MLManager:
         if not self.worker:
             return
 
-        server_address = self.config.aggregator_url.replace("http://", "").replace("https://", "") if hasattr(self.config, 'aggregator_url') else "127.0.0.1:8080"
+        if not HAS_FLWR:
+            logger.warning("Flower not installed, skipping FL loop")
+            return
+
+        import flwr as fl
+
+        server_address = self._server_address
         retry_interval = self.INITIAL_RETRY_INTERVAL
+        start_client = fl.client.start_numpy_client
+        wait = self._stop_event.wait
 
         while self.running:
             try:
-                import flwr as fl
-                # Run if flwr is installed
                 if server_address:
                     logger.info(f"Connecting to aggregator at {server_address}")
-                    fl.client.start_numpy_client(server_address=server_address, client=self.worker)
+                    start_client(server_address=server_address, client=self.worker)
                     retry_interval = self.INITIAL_RETRY_INTERVAL  # Reset on success
-            except ImportError:
-                logger.warning("Flower not installed, skipping FL loop")
-                break
             except Exception as e:
                 logger.error(f"Flower client error: {e}")
 
             # Exponential backoff with event-based wait for responsive shutdown
-            if self._stop_event.wait(timeout=retry_interval):
+            if wait(timeout=retry_interval):
                 break  # Stop event was set
             retry_interval = min(retry_interval * 2, self.MAX_RETRY_INTERVAL)
 
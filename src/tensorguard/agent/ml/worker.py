@@ -6,14 +6,18 @@ Refactored from original EdgeClient.
 """
 
 import numpy as np
+import os
 import time
-import hashlib
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Deque, List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
 from tensorguard.core.adapters import VLAAdapter
 from tensorguard.core.crypto import N2HEEncryptor
+from tensorguard.core.privacy.rdp import RDPAccountant
 from tensorguard.core.pipeline import GradientClipper, RandomSparsifier, ExpertGater, APHECompressor, QualityMonitor
 from tensorguard.core.production import (
     OperatingEnvelope,
@@ -31,6 +35,12 @@ from tensorguard.core.production import (
 from tensorguard.schemas.common import Demonstration
 from tensorguard.utils.production_gates import ProductionGateError, is_production, require_dependency
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 fl = require_dependency(
     "flwr",
     package_name="flwr",
@@ -39,6 +49,31 @@ fl = require_dependency(
 
 logger = logging.getLogger(__name__)
 
+
+def _split_sparse_residual(flat, scale, indices, out, prev_indices, residual):
+    """
+    Per-tensor kernel of the fused clip/sparsify/error-memory step (1-D views).
+
+    Scales flat in place, clears the entries of out written last round, then
+    writes the kept entries to out and everything else to residual.
+    """
+    for i in prev_indices:
+        out[i] = 0
+    for i in range(flat.size):
+        scaled = flat[i] * scale
+        flat[i] = scaled
+        residual[i] = scaled
+    for i in indices:
+        out[i] = flat[i]
+        residual[i] = 0
+
+
+if HAS_NUMBA:
+    # Compiled once per dtype and cached on disk, so restarts skip the JIT
+    _split_sparse_residual = njit(cache=True, nogil=True)(_split_sparse_residual)
+
+_NO_INDICES = np.empty(0, dtype=np.intp)
+
 @dataclass
 class WorkerConfig:
     """Configuration for TrainingWorker."""
@@ -49,6 +84,9 @@ class WorkerConfig:
     compression_ratio: float = 4.0
     key_path: str = "keys/tensorguard.key"
     security_level: int = 128
+    # Compute per-demo gradients on a thread pool (for adapters that release the GIL)
+    parallel_demos: bool = False
+    max_demo_workers: Optional[int] = None  # Defaults to os.cpu_count()
 
 class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
     """
@@ -80,6 +118,7 @@ class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
             epsilon_budget=self.config.dp_epsilon
         )
         self.observability = ObservabilityCollector() if enable_observability else None
+        self._accountant = RDPAccountant()
         
         # Pipeline Components
         self._clipper = GradientClipper(self.dp_profile.clipping_norm)
@@ -91,15 +130,22 @@ class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
         self._quality_monitor = QualityMonitor()
         
         # State
+        self._MAX_BUFFER_SIZE = 100
         self._adapter: Optional[VLAAdapter] = None
-        self._current_round_demos: List[Any] = []  # Demonstration objects
+        # Demonstration objects; the deque evicts the oldest in O(1) when full
+        self._current_round_demos: Deque[Any] = deque(maxlen=self._MAX_BUFFER_SIZE)
         self._privacy_budget_used = 0.0
         self._total_submissions = 0
         self._error_memory: Dict[str, np.ndarray] = {}
-        self._error_memory_last_seen: Dict[str, int] = {}
+        self._rng = np.random.default_rng()  # Sparsification index draws
+        # Round-to-round scratch: the sparsification key buffer, and per tensor
+        # the sparse output buffer plus the indices last written into it
+        self._key_buffer = np.empty(0, dtype=np.float32)
+        self._sparse_buffers: Dict[str, Tuple[np.ndarray, Any]] = {}
         self._current_round = 0
-        self._MAX_BUFFER_SIZE = 100
-        self._ERROR_MEMORY_MAX_STALE_ROUNDS = 10
+        self._pruner: Optional['PruningManager'] = None
+        self._pruner_resolved = False
+        self._pruned_adapter: Optional[VLAAdapter] = None  # Adapter the 2:4 policy was last applied to
         
         logger.info(f"TrainingWorker initialized for {self.config.model_type}")
 
@@ -108,13 +154,136 @@ class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
         self._adapter = adapter
         logger.info(f"Adapter configured: {type(adapter).__name__}")
 
+    @property
+    def pruner(self) -> Optional['PruningManager']:
+        """PruningManager, imported and constructed on first use (None if unavailable)."""
+        if not self._pruner_resolved:
+            try:
+                from ...optimization.pruning import PruningManager
+                self._pruner = PruningManager()
+            except ImportError:
+                logger.warning("PruningManager not found, skipping optimization.")
+            self._pruner_resolved = True
+        return self._pruner
+
     def add_demonstration(self, demo: Any):
         """Buffer a demonstration."""
-        if len(self._current_round_demos) >= self._MAX_BUFFER_SIZE:
+        if len(self._current_round_demos) == self._MAX_BUFFER_SIZE:
             logger.warning("Buffer full, dropping oldest demo")
-            self._current_round_demos.pop(0)
         self._current_round_demos.append(demo)
 
+    @staticmethod
+    def _accumulate(combined: Dict[str, np.ndarray], grads: Dict[str, np.ndarray]) -> None:
+        """
+        Sum grads into combined in place.
+
+        The first time a key is seen its gradient is copied into an owned
+        floating-point buffer; later demos add into that buffer without
+        allocating a new array per update.
+        """
+        for k, v in grads.items():
+            buf = combined.get(k)
+            if buf is None:
+                combined[k] = np.array(v, dtype=np.result_type(v, np.float32), copy=True)
+            else:
+                np.add(buf, v, out=buf)
+
+    def _demo_gradient_results(self):
+        """
+        One zero-arg callable per buffered demo, in buffer order, returning its
+        adapter gradients (or raising its error).
+
+        With parallel_demos, all demos are computed up front on a thread pool
+        and the callables just collect the results; otherwise each callable
+        computes its demo lazily.
+        """
+        demos = list(self._current_round_demos)
+        compute = self._adapter.compute_expert_gradients
+        if not self.config.parallel_demos or len(demos) < 2:
+            return [partial(compute, demo) for demo in demos]
+        
+        workers = min(len(demos), self.config.max_demo_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="demo-grad") as pool:
+            futures = [pool.submit(compute, demo) for demo in demos]
+        return [future.result for future in futures]
+
+    def _clip_sparsify_update_memory(self, grads: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Fused GradientClipper -> RandomSparsifier -> error-memory update.
+
+        Same semantics as running the three stages separately (global-norm
+        clip, Rand-K selection, residual = clipped - sparse), but each tensor
+        is scaled in place and then touched once more to split it into the
+        transmitted entries and the residual, with no intermediate dicts.
+        grads must be owned buffers; they are clipped in place. With numba
+        installed the per-tensor split runs as one compiled loop. The returned
+        arrays are recycled by the next call, so consume them within the round.
+        """
+        total_norm = GradientClipper.global_norm(grads)
+        clip_coef = min(self._clipper.max_norm / (total_norm + 1e-6), 1.0)
+        ratio = self._sparsifier.sparsity_ratio
+        
+        # One RNG draw for every tensor; each tensor keeps exactly k entries,
+        # picked as the k smallest of its slice of uniform keys (a uniformly
+        # random k-subset, as with choice(replace=False)).
+        total = sum(v.size for v in grads.values())
+        if self._key_buffer.size < total:
+            self._key_buffer = np.empty(total, dtype=np.float32)
+        keys = self._rng.random(total, dtype=np.float32, out=self._key_buffer[:total])
+        offset = 0
+        
+        error_memory = self._error_memory
+        sparse_buffers = self._sparse_buffers
+        sparse: Dict[str, np.ndarray] = {}
+        new_memory: Dict[str, np.ndarray] = {}
+        new_buffers: Dict[str, Tuple[np.ndarray, Any]] = {}
+        for k, v in grads.items():
+            n = v.size
+            if n == 0:
+                sparse[k] = v
+                new_memory[k] = np.zeros_like(v)
+                continue
+            
+            keep = max(1, int(n * ratio))
+            if keep < n:
+                # Copy so the cached indices don't pin the full argpartition result
+                indices = np.argpartition(keys[offset:offset + n], keep - 1)[:keep].copy()
+            else:
+                indices = np.arange(n)
+            offset += n
+            
+            # Reuse last round's output: only the entries it transmitted are
+            # non-zero, so clearing those is enough (O(k) instead of O(n))
+            cached = sparse_buffers.get(k)
+            if cached is not None and cached[0].shape == v.shape and cached[0].dtype == v.dtype:
+                out, prev_indices = cached
+            else:
+                out, prev_indices = np.zeros_like(v), _NO_INDICES
+            
+            # Residual is everything that was not transmitted
+            em = error_memory.get(k)
+            if em is None or em.shape != v.shape:
+                em = np.empty_like(v)
+            
+            if HAS_NUMBA and v.flags.c_contiguous:
+                _split_sparse_residual(v.reshape(-1), clip_coef, indices, out.reshape(-1), prev_indices, em.reshape(-1))
+            else:
+                if clip_coef < 1.0:
+                    np.multiply(v, clip_coef, out=v)
+                flat = v.reshape(-1)
+                out.reshape(-1)[prev_indices] = 0
+                out.reshape(-1)[indices] = flat[indices]
+                np.copyto(em, v, casting="same_kind")
+                em.reshape(-1)[indices] = 0
+            
+            sparse[k] = out
+            new_buffers[k] = (out, indices)
+            new_memory[k] = em
+        
+        self._error_memory = new_memory
+        self._sparse_buffers = new_buffers
+        return sparse
+
     def process_round(self) -> Optional[bytes]:
         """Execute a training round."""
         if not self._current_round_demos:
@@ -125,38 +294,39 @@ class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
             return None
 
         # --- DP ENFORCEMENT ---
-        # WARNING: This is a SIMPLIFIED DP implementation for demonstration.
-        # A production DP system requires:
-        # 1. Rényi Differential Privacy (RDP) accountant for tight composition
-        # 2. Calibrated Gaussian noise based on sensitivity and privacy budget
-        # 3. Per-sample gradient clipping with known sensitivity bounds
-        # 4. Subsampling amplification tracking
+        # Privacy loss is tracked with a Rényi DP accountant over the Sampled
+        # Gaussian Mechanism (one step per round) and converted to (ε, δ)-DP.
+        # Each round is charged the increase in cumulative ε, so the profile's
+        # epsilon_consumed always equals the accountant's composed ε.
         #
-        # Current implementation uses fixed epsilon consumption as a placeholder.
-        # For production, integrate: opacus, tensorflow-privacy, or dp-accounting
+        # WARNING: This is NOT yet a DP guarantee. The pipeline below only does
+        # clip -> Rand-K -> APHE -> encrypt; no Gaussian noise is added, so the
+        # ε reported here is for a mechanism that is not applied. Production
+        # additionally requires:
+        # 1. Calibrated Gaussian noise (std = noise_multiplier * clipping_norm)
+        # 2. Per-sample gradient clipping with known sensitivity bounds
         #
-        # TODO(security): Implement proper RDP accountant before production
+        # TODO(security): Add the noise step before relying on dp_epsilon_consumed
         # See: https://arxiv.org/abs/1702.07476 (Rényi DP)
         # See: https://github.com/pytorch/opacus (Reference implementation)
-
-        # Compute epsilon for this round based on noise multiplier and sampling rate
-        # In a real implementation: epsilon = rdp_accountant.get_epsilon(delta, steps)
         noise_multiplier = getattr(self.dp_profile, 'noise_multiplier', 1.0)
         sample_rate = min(len(self._current_round_demos) / 1000.0, 1.0)  # Assume 1000 total
+        delta = self.dp_profile.delta
 
-        # Simplified epsilon estimation (NOT production-ready)
-        # Real formula involves RDP→(ε,δ)-DP conversion
-        round_epsilon = 2.0 * sample_rate / (noise_multiplier ** 2) if noise_multiplier > 0 else float('inf')
-        round_epsilon = max(0.1, min(round_epsilon, 1.0))  # Clamp for stability
+        round_epsilon = (
+            self._accountant.epsilon_after(noise_multiplier, sample_rate, delta)
+            - self._accountant.get_epsilon(delta)
+        )
 
         logger.warning(
-            f"DP NOTICE: Using simplified epsilon estimation (ε={round_epsilon:.3f}). "
-            f"Production requires RDP accountant integration."
+            f"DP NOTICE: ε={round_epsilon:.3f} accounted for this round, but no Gaussian "
+            f"noise is applied. Not production-ready."
         )
 
         if not self.dp_profile.consume_epsilon(round_epsilon):
             logger.critical(f"FATAL: DP Epsilon Budget Exhausted. Privacy Guard enforced. Aborting round.")
             return None
+        self._accountant.step(noise_multiplier, sample_rate)
         # ----------------------
 
         self._current_round += 1
@@ -168,22 +338,20 @@ class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
             combined_grads = {}
             processed_count = 0
             
-            for demo in self._current_round_demos:
+            for get_result in self._demo_gradient_results():
                 try:
-                    res = self._adapter.compute_expert_gradients(demo)
+                    res = get_result()
                     if isinstance(res, tuple):
                         experts, gate_weights = res
                         self._current_expert_weights = gate_weights
                         gated = self._gater.gate(experts, gate_weights)
-                        for k, v in gated.items():
-                            combined_grads[k] = combined_grads.get(k, 0) + v
+                        self._accumulate(combined_grads, gated)
                     else:
                         # Fallback for simple dict return {expert_name: {param: grad}}
                         for exp_name, grads in res.items():
                             # If it's a known expert but missing from our local routing, 
                             # we still want to aggregate its contributions if possible
-                            for k, v in grads.items():
-                                combined_grads[k] = combined_grads.get(k, 0) + v
+                            self._accumulate(combined_grads, grads)
                                 
                     processed_count += 1
                 except Exception as e:
@@ -192,31 +360,28 @@ class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
             if not combined_grads:
                 return None
                 
-            self._current_round_demos = []
+            self._current_round_demos.clear()
             latency.train_ms = (time.time() - train_start) * 1000
             
             # 2. Privacy Pipeline
-            # Residuals
-            for k, v in self._error_memory.items():
-                if k in combined_grads: combined_grads[k] += v
+            # Residuals (walk this round's keys; memory holds only last round's)
+            error_memory = self._error_memory
+            for k, buf in combined_grads.items():
+                em = error_memory.get(k)
+                if em is not None:
+                    np.add(buf, em, out=buf)
                 
-            # Clip
-            clipped = self._clipper.clip(combined_grads)
-            
-            # Sparsify
-            sparse = self._sparsifier.sparsify(clipped)
-            
-            # Update Error Memory
-            self._error_memory = {k: clipped[k] - sparse[k] for k in clipped if k in sparse}
-            
-            # Prune memory
-            # ... (omitted for brevity, same logic as before)
+            # Clip, sparsify and update error memory in one pass per tensor.
+            # Memory is rebuilt from this round's keys, so stale entries never
+            # accumulate and need no separate pruning.
+            sparse = self._clip_sparsify_update_memory(combined_grads)
             
             # --- GLOBAL POLICY ENFORCEMENT ---
             # Automatically apply 2:4 sparsity to all edge nodes to ensure hardware acceleration compatibility.
-            try:
-                from ...optimization.pruning import PruningManager
-                pruner = PruningManager()
+            # Local rounds never change the model weights, so the 2:4 masks only
+            # need applying once per adapter (set_adapter swaps it).
+            pruner = self.pruner
+            if pruner is not None and self._pruned_adapter is not self._adapter:
                 # Check global config or default to FORCE
                 # In a real agent, this would fetch from the ConfigManager
                 logger.info("[POLICY] Enforcing Global 2:4 Sparsity Strategy on Edge Node")
@@ -228,27 +393,29 @@ class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
                     # Simulation / Stub
                     logger.info("[POLICY] Skipping structured pruning on mock model dict")
                     pruner.apply_2_4_sparsity(None)
-            except ImportError:
-                logger.warning("PruningManager not found, skipping optimization.")
+                self._pruned_adapter = self._adapter
             # ---------------------------------
             
             # 3. Compression & Encryption
-            pixel_data = self._compressor.compress(sparse)
+            # Quantization error joins the residual so it is re-sent next round
+            pixel_data = self._compressor.compress(sparse, residual_out=self._error_memory)
             encrypted = self._encryptor.encrypt(pixel_data)
             
-            # Create Package
+            # Create Package (module names and shapes in a single walk)
+            tensor_shapes = {k: v.shape for k, v in combined_grads.items()}
             update_package = UpdatePackage(
                 client_id=self.cid,
                 target_map=ModelTargetMap(
-                    module_names=list(combined_grads.keys()),
+                    module_names=list(tensor_shapes),
                     adapter_ids=self.operating_envelope.trainable_modules,
-                    tensor_shapes={k: v.shape for k, v in combined_grads.items()}
+                    tensor_shapes=tensor_shapes
                 ),
                 delta_tensors={"encrypted": encrypted},
                 compression_metadata={
                     "ratio": self.config.compression_ratio,
                     "gradient_sparsity": f"Rand-{int(self.config.sparsity*100)}%", # Communication Optimization
                     "model_sparsity": "50% (2:4 Structured)", # Compute Optimization
+                    "quantization_bits": self._compressor.bits,
                     "size": len(encrypted)
                 },
                 expert_weights=getattr(self, '_current_expert_weights', {}),
@@ -280,9 +447,13 @@ class TrainingWorker(fl.client.NumPyClient if fl is not None else object):
     def fit(self, parameters: List[np.ndarray], config: Dict[str, Any]) -> Tuple[List[np.ndarray], int, Dict[str, Any]]:
         pkg_bytes = self.process_round()
         if pkg_bytes:
-            # Chunking logic for gRPC
+            # Chunking logic for gRPC. NumPyClient must return ndarrays, so each
+            # chunk is a zero-copy uint8 view over a memoryview slice.
             chunk_size = 1024 * 1024
-            payload = np.frombuffer(pkg_bytes, dtype=np.uint8)
-            chunks = [payload[i:i+chunk_size] for i in range(0, len(payload), chunk_size)]
+            view = memoryview(pkg_bytes)
+            chunks = [
+                np.frombuffer(view[i:i + chunk_size], dtype=np.uint8)
+                for i in range(0, len(view), chunk_size)
+            ]
             return chunks, 1, {"status": "ok"}
         return [], 0, {"error": "no_data"}
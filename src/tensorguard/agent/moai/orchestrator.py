@@ -12,22 +12,85 @@ SECURITY NOTE: Uses safe deserialization instead of pickle.
 
 import logging
 import io
-import tarfile
 import json
 import numpy as np
 from typing import Optional, Dict
 
 from ...crypto.payload import PayloadDecryptor
 from ...serving.backend import TenSEALBackend
-from ...moai.modelpack import ModelPack
+from ...moai.modelpack import FLAT_MAGIC, ModelPack
 from ...tgsp.format import read_tgsp_header
 from ...crypto.kem import decap_hybrid
 from ...utils.serialization import safe_loads
-import tempfile
-import os
 
 logger = logging.getLogger(__name__)
 
+MODEL_PACK_MEMBERS = ("model_pack.msgpack", "model_pack.bin")  # Preferred first
+
+# tarfile is imported only when a payload is actually an archive; bare
+# flat-layout packs load without it. Same value as tarfile.BLOCKSIZE.
+_TAR_BLOCKSIZE = 512
+
+
+def _looks_like_archive(head: bytes) -> bool:
+    """Sniff a (possibly compressed) tar from its first block."""
+    return (
+        head[:2] == b"\x1f\x8b"            # gzip
+        or head[:3] == b"BZh"               # bzip2
+        or head[:6] == b"\xfd7zXZ\x00"      # xz
+        or head[257:262] == b"ustar"        # POSIX/GNU tar
+    )
+
+
+class _DecryptingReader(io.RawIOBase):
+    """
+    Read-only stream of TGSP payload plaintext, decrypted chunk by chunk.
+
+    Only the chunk being consumed is held in memory, so the payload can be
+    piped straight into tarfile's streaming mode without buffering it whole.
+    """
+
+    def __init__(self, stream, decryptor: PayloadDecryptor, payload_len: int):
+        self._stream = stream
+        self._decryptor = decryptor
+        self._remaining = payload_len
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_chunk(self) -> Optional[bytes]:
+        if self._remaining <= 0:
+            return None
+        chunk = self._decryptor.decrypt_chunk_from_stream(self._stream)
+        if not chunk:
+            self._remaining = 0
+            return None
+        self._remaining -= 4 + len(chunk) + 16  # u32 length + ciphertext + tag
+        return chunk
+
+    def peek(self, size: int) -> bytes:
+        """Return up to size upcoming bytes without consuming them."""
+        pending = bytes(self._pending)
+        while len(pending) < size:
+            chunk = self._next_chunk()
+            if chunk is None:
+                break
+            pending += chunk
+        self._pending = memoryview(pending)
+        return pending[:size]
+
+    def readinto(self, b) -> int:
+        if not self._pending:
+            chunk = self._next_chunk()
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
 
 class SecureMemoryLoader:
     """
@@ -44,36 +107,84 @@ class SecureMemoryLoader:
 
         SECURITY: Uses ModelPack.deserialize() which uses safe msgpack
         instead of pickle to prevent arbitrary code execution.
+
+        Flat-layout packs are loaded zero-copy: their weights are views into
+        the stream's buffer, which therefore cannot be resized afterwards.
+        This holds for packs inside an uncompressed TAR as well, since the
+        member's bytes sit in the buffer verbatim.
         """
-        encrypted_bytes = encrypted_stream.getvalue()
+        # Read the caller's buffer in place: getvalue() plus a second BytesIO
+        # would hold two extra copies of the plaintext model at peak.
+        encrypted_stream.seek(0)
+
+        with encrypted_stream.getbuffer() as view:
+            if bytes(view[:len(FLAT_MAGIC)]) == FLAT_MAGIC:
+                # Bare flat-layout pack: no archive to open
+                return ModelPack.deserialize(view)
+
+        import tarfile
 
         try:
             # Try to load from TAR archive first
-            with tarfile.open(fileobj=io.BytesIO(encrypted_bytes), mode="r:*") as tar:
-                # Look for the model pack file (now using safe format)
-                member_name = "model_pack.msgpack"
-                try:
-                    f = tar.extractfile(member_name)
-                    if f:
-                        return ModelPack.deserialize(f.read())
-                except KeyError:
-                    # Fallback to legacy name
-                    member_name = "model_pack.bin"
-                    try:
-                        f = tar.extractfile(member_name)
-                        if f:
-                            return ModelPack.deserialize(f.read())
-                    except KeyError:
-                        logger.error("No model_pack file found in payload")
-                        raise
+            with tarfile.open(fileobj=encrypted_stream, mode="r:*") as tar:
+                # Look for the model pack file (safe format first, then legacy
+                # name). Headers are read lazily, so stop at the preferred one
+                # rather than indexing the whole archive as getmember() would.
+                member = legacy = None
+                for info in tar:
+                    if info.name == MODEL_PACK_MEMBERS[0]:
+                        member = info
+                        break
+                    if legacy is None and info.name in MODEL_PACK_MEMBERS:
+                        legacy = info
+                member = member or legacy
+                if member is None:
+                    logger.error("No model_pack file found in payload")
+                    raise KeyError(MODEL_PACK_MEMBERS[0])
+
+                if tar.fileobj is encrypted_stream and member.isreg() and not member.issparse():
+                    # Uncompressed: slice the member out of the buffer instead
+                    # of copying it through extractfile().read()
+                    start = member.offset_data
+                    return ModelPack.deserialize(encrypted_stream.getbuffer()[start:start + member.size])
+                f = tar.extractfile(member)
+                if f:
+                    return ModelPack.deserialize(f.read())
         except tarfile.TarError as e:
             # Not a TAR file, try direct deserialization
             logger.debug(f"Not a TAR archive, trying direct deserialization: {e}")
             try:
-                return ModelPack.deserialize(encrypted_bytes)
+                with encrypted_stream.getbuffer() as view:
+                    return ModelPack.deserialize(view)
             except Exception:
                 raise ValueError("Could not load ModelPack from memory")
 
+    @staticmethod
+    def load_from_tar_stream(fileobj) -> ModelPack:
+        """
+        Load a ModelPack from a non-seekable (possibly compressed) tar stream.
+
+        Members are visited in archive order; model_pack.msgpack wins over the
+        legacy model_pack.bin regardless of which comes first.
+        """
+        import tarfile
+
+        legacy = None
+        with tarfile.open(fileobj=fileobj, mode="r|*") as tar:
+            for member in tar:
+                if member.name not in MODEL_PACK_MEMBERS:
+                    continue
+                f = tar.extractfile(member)
+                if f is None:
+                    continue
+                if member.name == MODEL_PACK_MEMBERS[0]:
+                    return ModelPack.deserialize(f.read())
+                legacy = f.read()
+        if legacy is None:
+            logger.error("No model_pack file found in payload")
+            raise KeyError(MODEL_PACK_MEMBERS[0])
+        return ModelPack.deserialize(legacy)
+
 
 class MoaiOrchestrator:
     """
@@ -95,15 +206,13 @@ class MoaiOrchestrator:
         """
         logger.info("Loading secure package into MOAI runtime...")
 
-        # Security: Write ENCRYPTED container to temp file for parsing.
-        # Plaintext is NEVER written to disk.
-        with tempfile.NamedTemporaryFile(delete=False) as tf:
-            tf.write(package_bytes)
-            tf_path = tf.name
+        # Parse the container in memory; nothing (encrypted or plaintext)
+        # touches disk.
+        container = io.BytesIO(package_bytes)
 
         try:
             # 1. Parse Header
-            data = read_tgsp_header(tf_path)
+            data = read_tgsp_header(container)
             h = data["header"]
 
             # 2. Decrypt DEK (Hybrid Unwrapping)
@@ -119,15 +228,20 @@ class MoaiOrchestrator:
             else:
                 device_sk = device_private_key
 
+            # Decode each recipient's wrapped DEK once, up front; a device
+            # typically tries (and fails) several recipients before its own.
+            from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+            candidates = []
             for rec in data["recipients"]:
                 try:
-                    ss_hybrid = decap_hybrid(device_sk, rec["encap"])
-
-                    from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
                     wrapper = rec["wrapper"]
-                    nonce = bytes.fromhex(wrapper["nonce"])
-                    ct = bytes.fromhex(wrapper["ct"])
+                    candidates.append((rec["encap"], bytes.fromhex(wrapper["nonce"]), bytes.fromhex(wrapper["ct"])))
+                except (KeyError, TypeError, ValueError):
+                    continue
 
+            for encap, nonce, ct in candidates:
+                try:
+                    ss_hybrid = decap_hybrid(device_sk, encap)
                     aead = ChaCha20Poly1305(ss_hybrid)
                     session_dek = aead.decrypt(nonce, ct, None)
                     break
@@ -144,23 +258,17 @@ class MoaiOrchestrator:
 
             decryptor = PayloadDecryptor(session_dek, nonce_base, m_hash, r_hash)
 
-            # 4. Stream Decrypt into Memory
-            decrypted_buffer = io.BytesIO()
+            # 4. Stream Decrypt, one chunk at a time
+            container.seek(data["payload_offset"])
+            plaintext = _DecryptingReader(container, decryptor, data["payload_len"])
 
-            with open(tf_path, "rb") as f:
-                f.seek(data["payload_offset"])
-                total_read = 0
-                while total_read < data["payload_len"]:
-                    chunk = decryptor.decrypt_chunk_from_stream(f)
-                    if not chunk:
-                        break
-                    decrypted_buffer.write(chunk)
-                    total_read += (4 + len(chunk) + 16)
-
-            decrypted_buffer.seek(0)
-
-            # 5. Load ModelPack (using safe deserialization)
-            model_pack = SecureMemoryLoader.load_from_stream(decrypted_buffer, session_dek)
+            # 5. Load ModelPack (using safe deserialization). Archives are
+            # untarred straight off the decrypting stream; anything else is a
+            # bare ModelPack and is read whole.
+            if _looks_like_archive(plaintext.peek(_TAR_BLOCKSIZE)):
+                model_pack = SecureMemoryLoader.load_from_tar_stream(io.BufferedReader(plaintext))
+            else:
+                model_pack = ModelPack.deserialize(plaintext.readall())
 
             # 6. Load Backend
             self.backend.load_model(model_pack)
@@ -173,9 +281,6 @@ class MoaiOrchestrator:
             logger.error(f"Failed to load secure package: {e}")
             self.is_ready = False
             raise
-        finally:
-            if os.path.exists(tf_path):
-                os.unlink(tf_path)
 
     def infer(self, ciphertext: bytes, eval_keys: bytes) -> bytes:
         """Proxy inference request to backend."""
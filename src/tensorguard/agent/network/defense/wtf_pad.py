@@ -6,8 +6,9 @@ Implements adaptive padding based on Juarez et al. (ESORICS 2016).
 
 import asyncio
 import numpy as np
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Callable, Awaitable
+from typing import Deque, Dict, List, Optional, Callable, Awaitable
 from enum import Enum
 import logging
 import time
@@ -27,21 +28,41 @@ class IATHistogram:
     bins: np.ndarray
     counts: np.ndarray
     
+    def __post_init__(self):
+        # Normalized once; sampling is then an O(log bins) CDF lookup
+        self._cdf = np.cumsum(self.counts, dtype=np.float64)
+        self._cdf /= self._cdf[-1]
+        self._cdf[-1] = 1.0
+    
     @classmethod
     def from_samples(cls, iats: np.ndarray, n_bins: int = 100) -> "IATHistogram":
         if len(iats) == 0:
             bins = np.linspace(0.001, 0.1, n_bins + 1)
             counts = np.ones(n_bins)
         else:
-            counts, bins = np.histogram(iats, bins=n_bins)
-            counts = np.maximum(counts, 1)
+            # Equal-width bins over [min, max] like np.histogram, but binned
+            # directly by index arithmetic + bincount
+            lo, hi = float(np.min(iats)), float(np.max(iats))
+            if not (np.isfinite(lo) and np.isfinite(hi)):
+                raise ValueError(f"IAT range [{lo}, {hi}] is not finite")
+            if lo == hi:
+                lo, hi = lo - 0.5, hi + 0.5
+            bins = np.linspace(lo, hi, n_bins + 1)
+            idx = ((np.asarray(iats) - lo) * (n_bins / (hi - lo))).astype(np.intp)
+            np.minimum(idx, n_bins - 1, out=idx)  # max lands in the last bin
+            counts = np.bincount(idx, minlength=n_bins)
+            np.maximum(counts, 1, out=counts)
         return cls(bins=bins, counts=counts)
     
     def sample(self, rng: np.random.Generator) -> float:
-        probs = self.counts / self.counts.sum()
-        bin_idx = rng.choice(len(self.counts), p=probs)
+        bin_idx = int(np.searchsorted(self._cdf, rng.random(), side="right"))
         iat = rng.uniform(self.bins[bin_idx], self.bins[bin_idx + 1])
         return float(iat)
+    
+    def sample_batch(self, rng: np.random.Generator, k: int) -> np.ndarray:
+        """Draw k IATs at once (same distribution as k calls to sample())."""
+        bin_idx = np.searchsorted(self._cdf, rng.random(k), side="right")
+        return rng.uniform(self.bins[bin_idx], self.bins[bin_idx + 1])
 
 
 @dataclass
@@ -59,6 +80,9 @@ class WTFPADConfig:
 class WTFPAD:
     """Zero-delay Adaptive Padding Defense."""
     
+    # IATs and dummy sizes are drawn this many at a time and handed out per packet
+    SAMPLE_BATCH_SIZE = 256
+    
     def __init__(
         self,
         config: Optional[WTFPADConfig] = None,
@@ -69,11 +93,23 @@ class WTFPAD:
         self.config = config or WTFPADConfig()
         self.rng = np.random.default_rng(random_seed)
         
-        self._burst_histogram = burst_histogram
-        self._gap_histogram = gap_histogram
+        # Defaults are built once here rather than on every sample
+        self._burst_histogram = burst_histogram or IATHistogram.from_samples(
+            np.array([0.01, 0.02, 0.03, 0.05]),
+            self.config.burst_histogram_bins
+        )
+        self._gap_histogram = gap_histogram or IATHistogram.from_samples(
+            np.array([0.1, 0.2, 0.3, 0.5]),
+            self.config.gap_histogram_bins
+        )
+        self._iat_pool: Dict[WTFPADState, Deque[float]] = {state: deque() for state in WTFPADState}
+        self._size_pool: Deque[int] = deque()
+        # Dummies are read-only slices of one zero buffer (no per-packet allocation)
+        self._zero_pool = memoryview(bytes(self.config.max_dummy_size))
         
         self.state = WTFPADState.GAP
-        self.last_packet_time = 0.0
+        self.last_packet_ns = 0  # time.monotonic_ns() of the last real packet
+        self._gap_threshold_ns = int(self.config.gap_threshold_s * 1e9)
         self.target_iat: Optional[float] = None
         self._timer_task: Optional[asyncio.Task] = None
         self._send_callback: Optional[Callable[[bytes], Awaitable[None]]] = None
@@ -86,28 +122,24 @@ class WTFPAD:
     
     def _get_histogram(self) -> IATHistogram:
         if self.state == WTFPADState.BURST:
-            if self._burst_histogram is None:
-                return IATHistogram.from_samples(
-                    np.array([0.01, 0.02, 0.03, 0.05]),
-                    self.config.burst_histogram_bins
-                )
             return self._burst_histogram
-        else:
-            if self._gap_histogram is None:
-                return IATHistogram.from_samples(
-                    np.array([0.1, 0.2, 0.3, 0.5]),
-                    self.config.gap_histogram_bins
-                )
-            return self._gap_histogram
+        return self._gap_histogram
     
     def _sample_target_iat(self) -> float:
-        histogram = self._get_histogram()
-        iat = histogram.sample(self.rng)
-        return max(self.config.min_iat_s, min(iat, self.config.max_iat_s))
+        pool = self._iat_pool[self.state]
+        if not pool:
+            iats = self._get_histogram().sample_batch(self.rng, self.SAMPLE_BATCH_SIZE)
+            np.clip(iats, self.config.min_iat_s, self.config.max_iat_s, out=iats)
+            pool.extend(iats.tolist())
+        return pool.popleft()
     
-    def _generate_dummy_packet(self) -> bytes:
-        size = self.rng.integers(self.config.min_dummy_size, self.config.max_dummy_size + 1)
-        return b'\x00' * size
+    def _generate_dummy_packet(self) -> memoryview:
+        """Zero-filled dummy of random size, as a bytes-like view (transports accept it)."""
+        if not self._size_pool:
+            self._size_pool.extend(self.rng.integers(
+                self.config.min_dummy_size, self.config.max_dummy_size + 1, size=self.SAMPLE_BATCH_SIZE
+            ).tolist())
+        return self._zero_pool[:self._size_pool.popleft()]
     
     async def _timeout_handler(self) -> None:
         try:
@@ -128,15 +160,15 @@ class WTFPAD:
             pass
     
     async def on_packet(self, packet: bytes) -> bytes:
-        current_time = time.monotonic()
-        iat = current_time - self.last_packet_time if self.last_packet_time > 0 else 0.0
+        now_ns = time.monotonic_ns()
+        iat_ns = now_ns - self.last_packet_ns if self.last_packet_ns else 0
         
-        if iat > self.config.gap_threshold_s:
+        if iat_ns > self._gap_threshold_ns:
             self.state = WTFPADState.GAP
         else:
             self.state = WTFPADState.BURST
         
-        self.last_packet_time = current_time
+        self.last_packet_ns = now_ns
         self.target_iat = self._sample_target_iat()
         self.stats["real_packets"] += 1
         
@@ -71,6 +71,7 @@ class TelemetryEmitter:
         self.enable_system_metrics = enable_system_metrics and PSUTIL_AVAILABLE
         self._metrics_thread: Optional[threading.Thread] = None
         self._running = False
+        self._stop_event = threading.Event()
 
         # Event queue for batching
         self._event_queue: List[Dict[str, Any]] = []
@@ -82,6 +83,7 @@ class TelemetryEmitter:
     def start(self):
         """Start background threads for system metrics and event flushing."""
         self._running = True
+        self._stop_event.clear()
 
         # Start system metrics collection
         if self.enable_system_metrics:
@@ -105,6 +107,7 @@ class TelemetryEmitter:
     def stop(self):
         """Stop background threads and flush remaining events."""
         self._running = False
+        self._stop_event.set()  # Wake sleeping loops immediately
 
         # Flush any remaining events
         self._flush_events()
@@ -303,8 +306,7 @@ class TelemetryEmitter:
 
     def _flush_loop(self):
         """Background loop to periodically flush events."""
-        while self._running:
-            time.sleep(self._flush_interval)
+        while not self._stop_event.wait(timeout=self._flush_interval):
             self._flush_events()
 
     def _flush_events(self):
@@ -439,11 +441,9 @@ class TelemetryEmitter:
             except Exception as e:
                 logger.error(f"Error collecting system metrics: {e}")
 
-            # Wait for next collection
-            for _ in range(int(self.system_metrics_interval)):
-                if not self._running:
-                    break
-                time.sleep(1)
+            # Wait for next collection (returns early on stop)
+            if self._stop_event.wait(timeout=self.system_metrics_interval):
+                break
 
     def _get_uptime(self) -> float:
         """Get process uptime in seconds."""
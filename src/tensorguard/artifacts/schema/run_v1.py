@@ -10,18 +10,10 @@ SCHEMA_NAME = "tensorguard.artifact.run.v1"
 def canonicalize(data: Dict[str, Any]) -> bytes:
     """
     Produce a deterministic byte representation of a dictionary for hashing.
-    Keys are sorted recursively.
+    Keys are sorted recursively (sort_keys applies at every nesting level).
     """
-    def _sort(obj):
-        if isinstance(obj, dict):
-            return {k: _sort(obj[k]) for k in sorted(obj)}
-        if isinstance(obj, list):
-            return [_sort(i) for i in obj]
-        return obj
-
-    canonical_data = _sort(data)
     # separators=(',', ':') removes whitespace
-    return json.dumps(canonical_data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8')
 
 def calculate_artifact_hash(data: Dict[str, Any]) -> str:
     """
@@ -3,18 +3,38 @@ tg-bench: TensorGuard Benchmark CLI
 """
 
 import argparse
+import importlib
 import sys
-from .micro import run_micro
-from .privacy.inversion import run_privacy
-from .robustness.byzantine import run_robustness
-from .compliance.evidence import run_evidence
-from .reporting import run_report
-import requests
 import json
 import os
 
+# Command -> module defining its run_<command> runner. Runners are imported
+# only when their command runs (they pull in numpy, scikit-learn,
+# matplotlib, ...), so --help and upload stay fast.
+_RUNNERS = {
+    "micro": ".micro",
+    "privacy": ".privacy.inversion",
+    "robustness": ".robustness.byzantine",
+    "evidence": ".compliance.evidence",
+    "report": ".reporting",
+}
+
+
+def _load_runner(command):
+    """Import and return the run_<command> function for a lazily loaded command."""
+    return getattr(importlib.import_module(_RUNNERS[command], __package__), f"run_{command}")
+
+
+def __getattr__(name):
+    # Keeps `from tensorguard.bench.cli import run_report` working
+    if name.startswith("run_") and name[4:] in _RUNNERS:
+        return _load_runner(name[4:])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def run_upload(args):
     """Upload benchmark run to Platform."""
+    import requests
+
     server = args.server.rstrip('/')
     
     # 1. Load artifact
@@ -88,18 +108,10 @@ def main():
 
     args = parser.parse_args()
     
-    if args.command == "micro":
-        run_micro(args)
+    if args.command in _RUNNERS:
+        _load_runner(args.command)(args)
     elif args.command == "updatepkg":
         print("Not implemented yet")
-    elif args.command == "privacy":
-        run_privacy(args)
-    elif args.command == "robustness":
-        run_robustness(args)
-    elif args.command == "evidence":
-        run_evidence(args)
-    elif args.command == "report":
-        run_report(args)
     elif args.command == "upload":
         run_upload(args)
     else:
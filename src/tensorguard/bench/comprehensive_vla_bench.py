@@ -7,6 +7,16 @@ import matplotlib.pyplot as plt
 from datetime import datetime, UTC
 from typing import Dict, List, Any
 
+_STYLE_APPLIED = False
+
+def _ensure_style():
+    """Load the plot style sheet once per process rather than on every plot."""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    plt.style.use('dark_background')
+    _STYLE_APPLIED = True
+
 # Mock external dependencies for benchmark isolation
 class MoEAdapter:
     def __init__(self):
@@ -173,7 +183,7 @@ class VLABenchmarkSuite:
         print(f"Research Report: artifacts/vla_research_report.json")
 
     def _generate_plots(self):
-        plt.style.use('dark_background')
+        _ensure_style()
         fig = plt.figure(figsize=(15, 10))
         
         cycles = range(self.total_cycles)
@@ -13,6 +13,12 @@ import os
 import psutil
 from typing import Dict, Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..core.crypto import N2HEEncryptor
 from ..core.production import UpdatePackage, ModelTargetMap
 
@@ -91,9 +97,15 @@ class MicroBenchmark:
         
     def save(self):
         filename = os.path.join(self.output_dir, f"micro_bench_{int(time.time())}.jsonl")
-        with open(filename, 'w') as f:
-            for r in self.results:
-                f.write(json.dumps(r) + "\n")
+        if HAS_ORJSON:
+            # Encodes straight to UTF-8 bytes, newline included
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            with open(filename, 'wb') as f:
+                f.write(b"".join(orjson.dumps(r, option=option) for r in self.results))
+        else:
+            with open(filename, 'w') as f:
+                for r in self.results:
+                    f.write(json.dumps(r) + "\n")
         print(f"Saved results to {filename}")
 
 def run_micro(args):
@@ -25,30 +25,39 @@ class PrivacyEvaluator:
         
         Metric: Relative Reconstruction Error (RRE)
         """
+        return self._simulate_reconstruction_batch(original, exposed[np.newaxis])[0]
+
+    def _simulate_reconstruction_batch(self, original: np.ndarray, exposed: np.ndarray) -> List[Dict[str, float]]:
+        """
+        Same metrics as _simulate_reconstruction for every row of an (S, D)
+        matrix of exposed vectors, reduced along D in one pass.
+        """
         # Simple attack assumption: Attacker tries to scale 'exposed' to match 'original'
         # In reality, exposed = grad(x). If grad is roughly x (e.g. Identity conv), leakage is high.
         # We simulate leakage by adding noise/clipping to original and asking "how close is it?"
         
-        mse = np.mean((original - exposed) ** 2)
+        diff = exposed - original
+        mse = np.mean(diff * diff, axis=1)
         norm_orig = np.mean(original ** 2)
         rre = mse / (norm_orig + 1e-9)
+        psnr = 10 * np.log10(1 / (mse + 1e-9))  # Mock PSNR
         
         # Privacy "Score" (Higher is better privacy, less reconstructability)
         # RRE=0 -> Perfect reconstruction (Score 0)
         # RRE=1 -> Baseline noise levels
         
-        return {
-            "mse": float(mse),
-            "rre": float(rre),
-            "simulated_attack_psnr": float(10 * np.log10(1 / (mse + 1e-9))) # Mock PSNR
-        }
+        return [
+            {"mse": m, "rre": r, "simulated_attack_psnr": p}
+            for m, r, p in zip(mse.tolist(), rre.tolist(), psnr.tolist())
+        ]
 
     def run_inversion_suite(self):
         print("Running Gradient Inversion Privacy Benchmark...")
         
         # 1. Setup Data (Simulate a sensitive image embedding)
         dim = 1024
-        secret_data = np.random.randn(dim).astype(np.float64)
+        rng = np.random.default_rng()
+        secret_data = rng.standard_normal(dim)
         
         # 2. Setup Real Encryption
         from ...moai.moai_config import MoaiConfig
@@ -79,15 +88,31 @@ class PrivacyEvaluator:
                 ints = np.pad(ints, (0, dim - len(ints)))
             return ints.astype(np.float64) / 255.0
 
+        # Random draws for the defenses reuse these buffers
+        mask = np.empty(dim)
+        noise = np.empty(dim)
+
+        def keep_10pct(x):
+            rng.random(out=mask)
+            return x * (mask > 0.9)
+
+        def gaussian_noise(x):
+            rng.standard_normal(out=noise)
+            np.multiply(noise, 0.5, out=noise)
+            return x + noise
+
         scenarios = {
             "Baseline (No Defense)": lambda x: x,
-            "TG-1 (Sparsify 90%)": lambda x: x * (np.random.rand(*x.shape) > 0.9),
-            "TG-2 (Clip+Sparse)": lambda x: np.clip(x, -0.5, 0.5) * (np.random.rand(*x.shape) > 0.9),
-            "TG-3 (DP Noise)": lambda x: np.clip(x, -0.5, 0.5) + np.random.normal(0, 0.5, size=x.shape),
+            "TG-1 (Sparsify 90%)": keep_10pct,
+            "TG-2 (Clip+Sparse)": lambda x: keep_10pct(np.clip(x, -0.5, 0.5)),
+            "TG-3 (DP Noise)": lambda x: gaussian_noise(np.clip(x, -0.5, 0.5)),
             "TG-4 (Full Encryption)": encrypt_wrapper
         }
         
-        results = []
+        # Each defense fills one row; the attack metrics are then computed for
+        # all scenarios at once.
+        exposed = np.empty((len(scenarios), dim), dtype=np.float64)
+        names = []
         
         for name, defense_fn in scenarios.items():
             print(f"  Testing {name}...")
@@ -95,17 +120,17 @@ class PrivacyEvaluator:
             
             # Apply Defense
             try:
-                exposed_gradient = defense_fn(gradient_proxy)
-                
-                # Attack
-                attack_metrics = self._simulate_reconstruction(secret_data, exposed_gradient)
-                
-                results.append({
-                    "scenario": name,
-                    "metrics": attack_metrics
-                })
+                exposed[len(names)] = defense_fn(gradient_proxy)
+                names.append(name)
             except Exception as e:
                 print(f"FAILED {name}: {e}")
+        
+        # Attack
+        attack_metrics = self._simulate_reconstruction_batch(secret_data, exposed[:len(names)])
+        results = [
+            {"scenario": name, "metrics": metrics}
+            for name, metrics in zip(names, attack_metrics)
+        ]
             
         # Save Report
         with open(os.path.join(self.output_dir, "inversion_results.json"), "w") as f:
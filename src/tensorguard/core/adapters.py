@@ -20,6 +20,8 @@ class VLAAdapter:
         self.model = model
         self._gradient_fn = gradient_fn
         self._apply_fn = apply_fn
+        # Parameter name -> expert category, filled as names are first seen
+        self._expert_of: Dict[str, str] = {}
     
     def compute_gradients(self, demo: Demonstration) -> Dict[str, np.ndarray]:
         """Compute gradients from demonstration."""
@@ -36,17 +38,27 @@ class VLAAdapter:
     def compute_expert_gradients(self, demo: Demonstration) -> Dict[str, Dict[str, np.ndarray]]:
         """Compute gradients split by 'Expert' category."""
         all_grads = self.compute_gradients(demo)
-        experts = {"visual": {}, "language": {}, "auxiliary": {}}
+        # (name, grad) pairs per bucket; each dict is then built in one go
+        buckets = {"visual": [], "language": [], "auxiliary": []}
+        # Model structure is static, so each name is classified only once
+        expert_of = self._expert_of
         
         for k, v in all_grads.items():
-            kl = k.lower()
-            if any(x in kl for x in ['vision', 'encoder', 'patch']):
-                experts["visual"][k] = v
-            elif any(x in kl for x in ['llm', 'language', 'decoder']):
-                experts["language"][k] = v
-            else:
-                experts["auxiliary"][k] = v
-        return experts
+            expert = expert_of.get(k)
+            if expert is None:
+                expert = expert_of[k] = self._classify_param(k)
+            buckets[expert].append((k, v))
+        return {expert: dict(items) for expert, items in buckets.items()}
+    
+    @staticmethod
+    def _classify_param(name: str) -> str:
+        """Expert category of a parameter name, by keyword substring."""
+        kl = name.lower()
+        if any(x in kl for x in ['vision', 'encoder', 'patch']):
+            return "visual"
+        if any(x in kl for x in ['llm', 'language', 'decoder']):
+            return "language"
+        return "auxiliary"
     
     @classmethod
     def from_pi0(cls, model_path: str) -> "VLAAdapter":
@@ -72,6 +84,16 @@ class MoEAdapter(VLAAdapter):
     Replaces magnitude-based heuristics with Instruction-Aware Expert Gating (DGMoE).
     Addresses parameter interference in heterogeneous federated fleets.
     """
+    # Simplified routing for simulation mapping blocks to experts
+    ROUTING_MAP = {
+        "visual_primary": [0, 1, 2, 3],
+        "visual_aux": [4, 5],
+        "language_semantic": [6, 7],
+        "manipulation_grasp": [8, 9]
+    }
+    # Sparsity Gating (EDA): experts at or below this gate weight get no gradients
+    GATE_THRESHOLD = 0.15
+
     def __init__(
         self,
         model: Any = None,
@@ -98,6 +120,11 @@ class MoEAdapter(VLAAdapter):
             "cleaning_wiping": ["wipe", "surface", "clean", "scrub", "pressure", "dust", "table"],
             "fastening_screwing": ["screw", "unscrew", "cap", "twist", "rotate", "thread", "bolt"]
         }
+        # Parameter names each expert owns, resolved once
+        self._expert_params = [
+            (expert, [f"block_{b_idx}.param" for b_idx in self.ROUTING_MAP.get(expert, [])])
+            for expert in self.experts
+        ]
 
     def _raise_missing_gradient_fn(self, model, demo: Demonstration):
         raise ValidationError(
@@ -113,10 +140,12 @@ class MoEAdapter(VLAAdapter):
             relevance = sum(2.5 for kw in kws if kw in instr)
             weights[exp] = relevance + 0.1
         
-        # Softmax normalize with stability
-        e_x = np.exp(list(weights.values()))
-        norm = e_x / (np.sum(e_x) + 1e-9)
-        return dict(zip(weights.keys(), norm))
+        # Softmax normalize with stability, in place on one buffer
+        vals = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+        vals -= vals.max()
+        np.exp(vals, out=vals)
+        vals /= vals.sum()
+        return dict(zip(weights, vals.tolist()))
 
     def compute_expert_gradients(self, demo: Demonstration) -> Dict[str, Dict[str, np.ndarray]]:
         """EDA (Expert-Driven Aggregation) gradient extraction."""
@@ -124,22 +153,15 @@ class MoEAdapter(VLAAdapter):
         raw_grads = self.compute_gradients(demo)
         
         expert_grads = {expert: {} for expert in self.experts}
-        # Simplified routing for simulation mapping blocks to experts
-        routing_map = {
-            "visual_primary": [0, 1, 2, 3],
-            "visual_aux": [4, 5],
-            "language_semantic": [6, 7],
-            "manipulation_grasp": [8, 9]
-        }
         
-        for expert in self.experts:
+        for expert, params in self._expert_params:
             weight = gate_weights.get(expert, 0.0)
-            if weight > 0.15: # Sparsity Gating (EDA)
-                blocks = routing_map.get(expert, [])
-                for b_idx in blocks:
-                    param = f"block_{b_idx}.param"
-                    if param in raw_grads:
-                        expert_grads[expert][param] = raw_grads[param] * weight
+            if weight > self.GATE_THRESHOLD:
+                grads = expert_grads[expert]
+                for param in params:
+                    grad = raw_grads.get(param)
+                    if grad is not None:
+                        grads[param] = grad * weight
         
         return expert_grads
         
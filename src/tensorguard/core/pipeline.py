@@ -3,6 +3,7 @@ TensorGuard Privacy Pipeline Components
 Implementing Differential Privacy, Sparsification, and Compression.
 """
 
+import math
 import numpy as np
 import gzip
 import msgpack  # Safe serialization (no RCE risk unlike pickle)
@@ -17,10 +18,23 @@ class GradientClipper:
     def __init__(self, max_norm: float = 1.0):
         self.max_norm = max_norm
     
-    def clip(self, gradients: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
-        total_norm = np.sqrt(sum(np.sum(g**2) for g in gradients.values()))
-        clip_coef = min(self.max_norm / (total_norm + 1e-6), 1.0)
-        return {k: v * clip_coef for k, v in gradients.items()}
+    @staticmethod
+    def global_norm(gradients: Dict[str, np.ndarray]) -> float:
+        """L2 norm over all tensors; BLAS dot per tensor, no squared temporaries."""
+        return math.sqrt(math.fsum(float(np.vdot(g.ravel(), g.ravel())) for g in gradients.values()))
+    
+    def clip(self, gradients: Dict[str, np.ndarray], inplace: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Scale all gradients by a common factor so their global norm is at most
+        max_norm. With inplace=True the input arrays are scaled and returned.
+        """
+        clip_coef = min(self.max_norm / (self.global_norm(gradients) + 1e-6), 1.0)
+        if not inplace:
+            return {k: v * clip_coef for k, v in gradients.items()}
+        if clip_coef < 1.0:
+            for v in gradients.values():
+                np.multiply(v, clip_coef, out=v)
+        return gradients
 
 class ExpertGater:
     """
@@ -40,7 +54,12 @@ class ExpertGater:
             weight = gate_weights.get(expert, 0.0)
             if weight > self.gate_threshold:
                 for k, v in grads.items():
-                    combined[k] = combined.get(k, 0) + v
+                    buf = combined.get(k)
+                    if buf is None:
+                        # Owned copy, so later experts can add in place
+                        combined[k] = np.array(v, dtype=np.result_type(v, np.float32))
+                    else:
+                        buf += v
         return combined
 
 class RandomSparsifier:
@@ -101,27 +120,71 @@ class APHECompressor:
     """
     def __init__(self, compression_ratio: int = 32):
         self.compression_ratio = compression_ratio
-        self.bits = max(2, 32 // compression_ratio)
+        self.bits = max(2, int(32 // compression_ratio))
     
-    def compress(self, gradients: Dict[str, np.ndarray]) -> bytes:
+    @staticmethod
+    def _pack(codes: np.ndarray, bits: int) -> bytes:
+        """Pack 2- or 4-bit codes little-end-first, 8 // bits per byte."""
+        per_byte = 8 // bits
+        flat = codes.reshape(-1)
+        pad = (-flat.size) % per_byte
+        if pad:
+            flat = np.concatenate([flat, np.zeros(pad, dtype=np.uint8)])
+        groups = flat.reshape(-1, per_byte)
+        packed = groups[:, 0].copy()
+        for j in range(1, per_byte):
+            packed |= groups[:, j] << (bits * j)
+        return packed.tobytes()
+
+    @staticmethod
+    def _unpack(data: bytes, bits: int, count: int) -> np.ndarray:
+        packed = np.frombuffer(data, dtype=np.uint8)
+        shifts = np.arange(0, 8, bits, dtype=np.uint8)
+        codes = (packed[:, None] >> shifts) & ((1 << bits) - 1)
+        return codes.reshape(-1)[:count]
+
+    def compress(self, gradients: Dict[str, np.ndarray],
+                 residual_out: Optional[Dict[str, np.ndarray]] = None) -> bytes:
+        """
+        Quantize and pack gradients.
+
+        With 2- or 4-bit codes, several codes share a byte. If residual_out
+        is given, each tensor's quantization error (grad - dequantized) is
+        added in place to the matching residual buffer, for error feedback.
+        """
         compressed_data = {}
+        levels = 2 ** self.bits
+        packable = self.bits in (2, 4)
         for name, grad in gradients.items():
             v_min, v_max = float(grad.min()), float(grad.max())
             if v_max - v_min > 1e-8:
-                normalized = (grad - v_min) / (v_max - v_min)
-                levels = 2 ** self.bits
-                quantized = np.round(normalized * (levels - 1)).astype(np.uint8)
+                # Quantize through a single float32 work buffer, whatever the
+                # input precision, instead of a chain of full-size temporaries.
+                work = np.subtract(grad, v_min, dtype=np.float32)
+                work *= (levels - 1) / (v_max - v_min)
+                np.rint(work, out=work)
+                quantized = work.astype(np.uint8)
             else:
                 quantized = np.zeros_like(grad, dtype=np.uint8)
                 v_min = v_max = 0.0
             
-            compressed_data[name] = {
-                'q': quantized.tobytes(),
+            if residual_out is not None and name in residual_out:
+                dequantized = quantized.astype(np.float32)
+                dequantized *= (v_max - v_min) / (levels - 1)
+                dequantized += v_min
+                residual_out[name] += grad
+                residual_out[name] -= dequantized
+            
+            entry = {
+                'q': self._pack(quantized, self.bits) if packable else quantized.tobytes(),
                 'dtype': str(quantized.dtype),
                 'min': v_min,
                 'max': v_max,
                 'shape': list(grad.shape)
             }
+            if packable:
+                entry['bits'] = self.bits
+            compressed_data[name] = entry
         return gzip.compress(msgpack.packb(compressed_data, use_bin_type=True))
     
     def decompress(self, data: bytes) -> Dict[str, np.ndarray]:
@@ -129,7 +192,12 @@ class APHECompressor:
         result = {}
         levels = 2 ** self.bits
         for name, payload in compressed_data.items():
-            quantized = np.frombuffer(payload['q'], dtype=np.uint8).reshape(payload['shape'])
+            shape = payload['shape']
+            if 'bits' in payload:
+                count = int(np.prod(shape, dtype=np.int64))
+                quantized = self._unpack(payload['q'], payload['bits'], count).reshape(shape)
+            else:
+                quantized = np.frombuffer(payload['q'], dtype=np.uint8).reshape(shape)
             dequantized = quantized.astype(np.float32) / (levels - 1)
             result[name] = (dequantized * (payload['max'] - payload['min']) + payload['min'])
         return result
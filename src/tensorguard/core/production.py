@@ -247,18 +247,19 @@ class UpdatePackage:
         metadata_json = json.dumps(package_dict, sort_keys=True, default=numpy_json_serializer).encode()
         metadata_size = len(metadata_json).to_bytes(4, 'big')
 
-        # Serialize delta tensors
-        delta_data = []
+        # Combine: [metadata_size][metadata][delta_tensors], joined once so the
+        # (potentially large) tensor payloads are copied a single time
+        parts = [metadata_size, metadata_json]
         for name, tensor_bytes in self.delta_tensors.items():
             name_bytes = name.encode()
-            name_size = len(name_bytes).to_bytes(4, 'big')
-            tensor_size = len(tensor_bytes).to_bytes(4, 'big')
-            delta_data.append(name_size + name_bytes + tensor_size + tensor_bytes)
-
-        delta_bytes = b''.join(delta_data)
+            parts += (
+                len(name_bytes).to_bytes(4, 'big'),
+                name_bytes,
+                len(tensor_bytes).to_bytes(4, 'big'),
+                tensor_bytes,
+            )
 
-        # Combine: [metadata_size][metadata][delta_tensors]
-        return metadata_size + metadata_json + delta_bytes
+        return b''.join(parts)
 
     @classmethod
     def deserialize(cls, data: bytes) -> 'UpdatePackage':
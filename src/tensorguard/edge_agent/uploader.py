@@ -40,7 +40,8 @@ class Uploader(threading.Thread):
         fleet_id: str,
         device_id: Optional[str] = None,
         batch_size: int = 50,
-        interval: float = 1.0
+        interval: float = 1.0,
+        session: Optional[requests.Session] = None
     ):
         super().__init__(daemon=True)
         self.spooler = spooler
@@ -52,6 +53,10 @@ class Uploader(threading.Thread):
         self.interval = interval
         self.running = False
 
+        # Reuse one keep-alive connection for every batch instead of a fresh TCP/TLS handshake per POST
+        self._owns_session = session is None
+        self.session = session or requests.Session()
+
         # Device info for registration
         self.agent_version = os.environ.get("TG_AGENT_VERSION", "1.0.0")
         self.runtime_version = os.environ.get("TG_RUNTIME_VERSION")
@@ -145,7 +150,7 @@ class Uploader(threading.Thread):
                 headers = self._build_headers(body)
 
                 # 4. Upload to telemetry ingest endpoint
-                response = requests.post(
+                response = self.session.post(
                     f"{self.target_url}/ingest",
                     data=body,
                     headers=headers,
@@ -200,3 +205,5 @@ class Uploader(threading.Thread):
         self.running = False
         if self.is_alive():
             self.join(timeout=5)
+        if self._owns_session:
+            self.session.close()
@@ -112,18 +112,36 @@ class FileBasedHTTP01:
     def __init__(self, webroot: str = "/var/www/html"):
         self.webroot = Path(webroot)
         self.challenge_dir = self.webroot / ".well-known" / "acme-challenge"
+        self._dir_ready = False  # Skip the per-challenge mkdir walk once created
     
     def add_challenge(self, token: str, key_authorization: str) -> Path:
         """Write challenge file to webroot."""
-        self.challenge_dir.mkdir(parents=True, exist_ok=True)
-        
         challenge_file = self.challenge_dir / token
-        challenge_file.write_text(key_authorization)
-        os.chmod(challenge_file, 0o644)
+        if not self._dir_ready:
+            self.challenge_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        
+        try:
+            self._write_file(challenge_file, key_authorization.encode())
+        except FileNotFoundError:
+            # Webroot was removed underneath us; recreate and retry once
+            self.challenge_dir.mkdir(parents=True, exist_ok=True)
+            self._write_file(challenge_file, key_authorization.encode())
         
         logger.info(f"Wrote HTTP-01 challenge file: {challenge_file}")
         return challenge_file
     
+    @staticmethod
+    def _write_file(path: Path, data: bytes) -> None:
+        """Single open/write/close, world-readable regardless of umask."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o644)
+        finally:
+            os.close(fd)
+    
     def remove_challenge(self, token: str) -> None:
         """Remove challenge file."""
         challenge_file = self.challenge_dir / token
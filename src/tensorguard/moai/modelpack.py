@@ -7,8 +7,9 @@ Pickle is not safe for untrusted data as it can execute arbitrary code.
 """
 
 import json
+import struct
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 import hashlib
 import warnings
 
@@ -28,6 +29,12 @@ class ModelPackMetadata:
     config: Dict[str, Any]
 
 
+# Flat layout: MAGIC | u32 header_len | header JSON | concatenated weight bytes.
+# The header indexes each weight as [name, offset, length] into the blob, so
+# loading hands out memoryview slices of the input instead of copies.
+FLAT_MAGIC = b"TGMP\x01\x00"
+
+
 @dataclass
 class ModelPack:
     """
@@ -60,13 +67,56 @@ class ModelPack:
             "tokenizer_config": self.tokenizer_config
         })
 
+    def serialize_flat(self) -> bytes:
+        """
+        Serialize to the flat layout (JSON header + raw weight blob).
+
+        Weight bytes are stored verbatim, without the hex expansion the
+        msgpack form applies to bytes values.
+        """
+        index = []
+        offset = 0
+        for name, blob in self.weights.items():
+            index.append([name, offset, len(blob)])
+            offset += len(blob)
+        header = json.dumps({
+            "meta": asdict(self.meta),
+            "tokenizer_config": self.tokenizer_config,
+            "weights": index,
+        }, default=str).encode("utf-8")
+        return b"".join([FLAT_MAGIC, struct.pack(">I", len(header)), header, *self.weights.values()])
+
+    @classmethod
+    def _deserialize_flat(cls, data: Union[bytes, memoryview]) -> 'ModelPack':
+        view = memoryview(data)
+        start = len(FLAT_MAGIC) + 4
+        (h_len,) = struct.unpack_from(">I", view, len(FLAT_MAGIC))
+        header = json.loads(bytes(view[start:start + h_len]))
+        blob = view[start + h_len:]
+        weights = {}
+        for name, offset, length in header["weights"]:
+            if offset < 0 or length < 0 or offset + length > len(blob):
+                raise ValueError(f"Weight {name} lies outside the ModelPack blob")
+            weights[name] = blob[offset:offset + length]  # Zero-copy view
+        return cls(
+            meta=ModelPackMetadata(**header["meta"]),
+            weights=weights,
+            tokenizer_config=header.get("tokenizer_config")
+        )
+
     @classmethod
-    def deserialize(cls, data: bytes) -> 'ModelPack':
+    def deserialize(cls, data: Union[bytes, memoryview]) -> 'ModelPack':
         """
         Deserialize from bytes using safe deserialization.
 
+        Accepts both the flat layout (weights come back as memoryview
+        slices of data, which must stay unmodified while in use) and the
+        legacy msgpack form.
+
         Safe for untrusted data - cannot execute arbitrary code.
         """
+        if bytes(data[:len(FLAT_MAGIC)]) == FLAT_MAGIC:
+            return cls._deserialize_flat(data)
         obj = safe_loads(data)
         meta = ModelPackMetadata(**obj["meta"])
         return cls(
@@ -83,6 +133,6 @@ class ModelPack:
         return cls.deserialize(data)
 
     def save(self, path: str) -> None:
-        """Save ModelPack to file using safe serialization."""
+        """Save ModelPack to file in the flat layout (load() reads both forms)."""
         with open(path, 'wb') as f:
-            f.write(self.serialize())
+            f.write(self.serialize_flat())
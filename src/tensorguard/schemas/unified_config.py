@@ -32,6 +32,10 @@ class IdentityConfig(BaseModel):
     scan_envoy: bool = True
     scan_filesystem: bool = False
     
+    # Scheduling (each task runs on its own cadence)
+    poll_interval_seconds: int = 3600
+    heartbeat_interval_seconds: int = 300
+    
     # Automation
     auto_renew: bool = True
     auto_deploy: bool = True
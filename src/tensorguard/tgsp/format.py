@@ -5,7 +5,7 @@ import hashlib
 import tempfile
 import os
 import shutil
-from typing import IO, List, Dict, Any
+from typing import IO, List, Dict, Any, Union
 
 from .manifest import PackageManifest
 from ..evidence.canonical import canonical_bytes
@@ -181,46 +181,54 @@ def write_tgsp_package_v1(output_path: str,
         "mode": "Post-Quantum Hybrid"
     }
 
-def read_tgsp_header(path: str) -> Dict:
+def read_tgsp_header(path: Union[str, IO[bytes]]) -> Dict:
     """
     Read TGSP v1.0 Header.
+
+    Accepts a container path or a seekable binary stream positioned at the
+    start of the container (e.g. io.BytesIO over in-memory package bytes).
     """
+    if hasattr(path, "read"):
+        return _read_tgsp_header(path)
     with open(path, "rb") as f:
-        magic = f.read(6)
-        if magic != MAGIC_V1:
-             raise ValueError(f"Invalid Magic: Expected {MAGIC_V1}, got {magic}")
-             
-        h_len = struct.unpack(">I", f.read(4))[0]
-        h_bytes = f.read(h_len)
-        header = json.loads(h_bytes)
-        
-        m_len = struct.unpack(">I", f.read(4))[0]
-        m_bytes = f.read(m_len)
-        manifest = json.loads(m_bytes)
-        
-        r_len = struct.unpack(">I", f.read(4))[0]
-        r_bytes = f.read(r_len)
-        recipients = json.loads(r_bytes)
-        
-        signed_area = h_bytes + m_bytes + r_bytes
-        
-        p_len = struct.unpack(">Q", f.read(8))[0]
-        payload_offset = f.tell()
-        f.seek(p_len, 1)
-        
-        s_len = struct.unpack(">I", f.read(4))[0]
-        sig_block = json.loads(f.read(s_len))
-        
-        return {
-            "version": "1.0",
-            "header": header,
-            "manifest": manifest,
-            "recipients": recipients,
-            "signature_block": sig_block,
-            "signed_area": signed_area,
-            "payload_offset": payload_offset,
-            "payload_len": p_len
-        }
+        return _read_tgsp_header(f)
+
+def _read_tgsp_header(f: IO[bytes]) -> Dict:
+    magic = f.read(6)
+    if magic != MAGIC_V1:
+         raise ValueError(f"Invalid Magic: Expected {MAGIC_V1}, got {magic}")
+         
+    h_len = struct.unpack(">I", f.read(4))[0]
+    h_bytes = f.read(h_len)
+    header = json.loads(h_bytes)
+    
+    m_len = struct.unpack(">I", f.read(4))[0]
+    m_bytes = f.read(m_len)
+    manifest = json.loads(m_bytes)
+    
+    r_len = struct.unpack(">I", f.read(4))[0]
+    r_bytes = f.read(r_len)
+    recipients = json.loads(r_bytes)
+    
+    signed_area = h_bytes + m_bytes + r_bytes
+    
+    p_len = struct.unpack(">Q", f.read(8))[0]
+    payload_offset = f.tell()
+    f.seek(p_len, 1)
+    
+    s_len = struct.unpack(">I", f.read(4))[0]
+    sig_block = json.loads(f.read(s_len))
+    
+    return {
+        "version": "1.0",
+        "header": header,
+        "manifest": manifest,
+        "recipients": recipients,
+        "signature_block": sig_block,
+        "signed_area": signed_area,
+        "payload_offset": payload_offset,
+        "payload_len": p_len
+    }
 
 def verify_tgsp_container(path: str, public_key: Dict = None) -> bool:
     """
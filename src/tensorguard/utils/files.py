@@ -12,6 +12,9 @@ def atomic_write(target_path: Union[str, Path], data: Union[str, bytes]):
     """
     Writes data to a file atomically via a temporary file.
     Prevents file corruption if the process is interrupted.
+
+    The temporary file is fsync'd before the rename, and the parent directory
+    after it (POSIX), so a crash can never leave a renamed-but-empty file.
     """
     target = Path(target_path)
     target.parent.mkdir(parents=True, exist_ok=True)
@@ -24,6 +27,8 @@ def atomic_write(target_path: Union[str, Path], data: Union[str, bytes]):
         suffix=".tmp"
     ) as tf:
         tf.write(data)
+        tf.flush()
+        os.fsync(tf.fileno())
         temp_name = tf.name
         
     try:
@@ -34,6 +39,14 @@ def atomic_write(target_path: Union[str, Path], data: Union[str, bytes]):
             os.unlink(temp_name)
         raise
 
+    # Make the rename itself durable (not supported on Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(target.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 def sanitize_path(path_str: str, base_dir: Optional[Union[str, Path]] = None) -> Path:
     """
     Sanitizes a path to prevent directory traversal attacks.
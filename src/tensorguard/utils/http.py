@@ -3,6 +3,12 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .logging import get_logger
 from .exceptions import CommunicationError
 
@@ -63,13 +69,23 @@ class StandardClient:
         try:
             response = self.session.request(method, url, timeout=timeout, **kwargs)
             response.raise_for_status()
-            return response.json() if response.content else {}
+            if not response.content:
+                return {}
+            # orjson parses the raw body directly, skipping requests' decode + json.loads
+            return orjson.loads(response.content) if HAS_ORJSON else response.json()
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP Error: {e.response.status_code} - {e.response.text}")
             raise CommunicationError(f"API Error: {e.response.status_code}") from e
         except requests.exceptions.RequestException as e:
             logger.error(f"Network Error: {e}")
             raise CommunicationError("Failed to connect to Control Plane") from e
+        except ValueError as e:
+            logger.error(f"Invalid JSON response: {e}")
+            raise CommunicationError("Malformed response from Control Plane") from e
+
+    def close(self):
+        """Release pooled keep-alive connections."""
+        self.session.close()
 
 def get_standard_client(base_url: str, api_key: Optional[str] = None) -> StandardClient:
     return StandardClient(base_url, api_key)
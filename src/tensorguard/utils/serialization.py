@@ -121,7 +121,7 @@ def safe_loads(data: bytes) -> Any:
     This is safe for untrusted data - it cannot execute arbitrary code.
 
     Args:
-        data: Bytes to deserialize
+        data: Bytes (or any bytes-like buffer) to deserialize
 
     Returns:
         Deserialized object
@@ -129,7 +129,7 @@ def safe_loads(data: bytes) -> Any:
     if HAS_MSGPACK:
         raw = msgpack.unpackb(data, raw=False)
     else:
-        raw = json.loads(data.decode('utf-8'))
+        raw = json.loads(bytes(data).decode('utf-8'))
 
     return _restore_from_serialization(raw)
 
@@ -324,6 +324,92 @@ class TestCSRGenerator:
             assert "example.com" in result.subject_dn
 
 
+class TestCSRKeyPrewarm:
+    """Tests for the background RSA key pool."""
+    
+    @staticmethod
+    def _generator(tmp_path, prewarm_keys=2):
+        pytest.importorskip("cryptography")
+        from tensorguard.agent.identity.csr_generator import CSRGenerator
+        from tensorguard.core.keys import UnifiedKeyManager
+        
+        generator = CSRGenerator(key_storage_path=str(tmp_path), prewarm_keys=prewarm_keys)
+        generator.vault = UnifiedKeyManager(vault_root=str(tmp_path))
+        return generator
+    
+    @staticmethod
+    def _wait_full(generator, timeout=30.0):
+        import time
+        deadline = time.monotonic() + timeout
+        while not generator._key_pool.full():
+            assert time.monotonic() < deadline, "key pool never filled"
+            time.sleep(0.05)
+    
+    def test_start_prewarm_fills_pool(self, tmp_path):
+        """Test the refill thread tops the pool up to prewarm_keys."""
+        generator = self._generator(tmp_path)
+        assert generator._key_pool.qsize() == 0
+        
+        generator.start_prewarm()
+        try:
+            self._wait_full(generator)
+        finally:
+            generator.stop_prewarm()
+        
+        assert generator._key_pool.qsize() == 2
+    
+    def test_pooled_key_used_for_csr(self, tmp_path):
+        """Test 2048-bit requests take a pooled key, including via generate_csr_with_new_key."""
+        generator = self._generator(tmp_path)
+        generator.start_prewarm()
+        self._wait_full(generator)
+        generator.stop_prewarm()  # No refills, so pool contents are predictable
+        
+        first, second = list(generator._key_pool.queue)
+        assert generator._take_prewarmed_key(2048) is first
+        
+        result = generator.generate_csr_with_new_key(common_name="example.com", key_size=2048)
+        
+        assert generator._get_key(result.key_id).private_key is second
+        assert generator._key_pool.empty()
+    
+    def test_other_key_size_generates_fresh(self, tmp_path):
+        """Test sizes other than PREWARM_RSA_KEY_SIZE leave the pool alone."""
+        generator = self._generator(tmp_path)
+        generator.start_prewarm()
+        self._wait_full(generator)
+        generator.stop_prewarm()
+        
+        assert generator._take_prewarmed_key(3072) is None
+        key_pair = generator.generate_key(key_type="RSA", key_size=3072)
+        
+        assert key_pair.private_key.key_size == 3072
+        assert generator._key_pool.qsize() == 2
+    
+    def test_stop_joins_thread_with_full_pool(self, tmp_path):
+        """Test stop_prewarm() returns promptly while the refill is blocked on a full pool."""
+        generator = self._generator(tmp_path, prewarm_keys=1)
+        generator.start_prewarm()
+        self._wait_full(generator)
+        thread = generator._prewarm_thread
+        
+        generator.stop_prewarm(timeout=5.0)
+        
+        assert not thread.is_alive()
+        assert generator._prewarm_thread is None
+    
+    def test_no_thread_without_prewarm(self, tmp_path):
+        """Test prewarm_keys=0 never starts a keygen thread."""
+        import threading
+        generator = self._generator(tmp_path, prewarm_keys=0)
+        
+        generator.start_prewarm()
+        
+        assert generator._key_pool is None
+        assert generator._prewarm_thread is None
+        assert not any(t.name == "csr-keygen" for t in threading.enumerate())
+
+
 # === Integration Tests ===
 
 class TestInventoryService:
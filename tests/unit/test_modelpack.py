@@ -0,0 +1,81 @@
+import io
+import tarfile
+
+import pytest
+from tensorguard.moai.modelpack import FLAT_MAGIC, ModelPack, ModelPackMetadata
+
+
+def _pack() -> ModelPack:
+    meta = ModelPackMetadata(
+        model_id="m-1",
+        version="1.0.0",
+        base_model="pi0",
+        target_modules=["policy_head"],
+        created_at="2025-01-01T00:00:00",
+        git_commit_hash="abc123",
+        config={"poly_modulus_degree": 8192},
+    )
+    return ModelPack(meta=meta, weights={"w": b"\x01" * 1000, "b": b"\x02\x03"}, tokenizer_config={"vocab": 8})
+
+
+def test_flat_roundtrip():
+    pack = _pack()
+    data = pack.serialize_flat()
+    assert data.startswith(FLAT_MAGIC)
+
+    loaded = ModelPack.deserialize(data)
+
+    assert loaded.meta == pack.meta
+    assert loaded.tokenizer_config == pack.tokenizer_config
+    assert {k: bytes(v) for k, v in loaded.weights.items()} == pack.weights
+    assert all(isinstance(v, memoryview) for v in loaded.weights.values())
+
+
+def test_legacy_msgpack_still_loads(tmp_path):
+    pack = _pack()
+    path = tmp_path / "legacy.bin"
+    path.write_bytes(pack.serialize())
+
+    loaded = ModelPack.load(str(path))
+
+    assert loaded.meta == pack.meta
+    assert loaded.weights == pack.weights
+
+
+def test_save_load_uses_flat_layout(tmp_path):
+    path = tmp_path / "pack.bin"
+    _pack().save(str(path))
+
+    assert path.read_bytes().startswith(FLAT_MAGIC)
+    assert bytes(ModelPack.load(str(path)).weights["b"]) == b"\x02\x03"
+
+
+def test_out_of_bounds_weight_rejected():
+    truncated = _pack().serialize_flat()[:-1]
+
+    with pytest.raises(ValueError, match="outside the ModelPack blob"):
+        ModelPack.deserialize(truncated)
+
+
+def test_secure_loader_reads_bare_flat_pack():
+    from tensorguard.agent.moai.orchestrator import SecureMemoryLoader
+
+    loaded = SecureMemoryLoader.load_from_stream(io.BytesIO(_pack().serialize_flat()), dek=b"")
+
+    assert bytes(loaded.weights["w"]) == b"\x01" * 1000
+
+
+def test_secure_loader_reads_uncompressed_tar_pack():
+    from tensorguard.agent.moai.orchestrator import SecureMemoryLoader
+
+    data = _pack().serialize_flat()
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        info = tarfile.TarInfo("model_pack.msgpack")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+
+    loaded = SecureMemoryLoader.load_from_stream(archive, dek=b"")
+
+    assert loaded.meta.model_id == "m-1"
+    assert {k: bytes(v) for k, v in loaded.weights.items()} == _pack().weights
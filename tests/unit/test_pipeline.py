@@ -1,7 +1,7 @@
 
 import pytest
 import numpy as np
-from tensorguard.core.pipeline import RandomSparsifier
+from tensorguard.core.pipeline import APHECompressor, RandomSparsifier
 
 class TestRandomSparsification:
     """Test suite for Random Sparsification (Rand-K)."""
@@ -60,3 +60,42 @@ class TestRandomSparsification:
         grads = {"layer1": np.array([])}
         sparse = sparsifier.sparsify(grads)
         assert sparse["layer1"].size == 0
+
+
+class TestAPHECompressor:
+    """Test suite for APHE quantization and bit packing."""
+    
+    @pytest.mark.parametrize("compression_ratio,bits", [(16, 2), (8, 4), (4, 8)])
+    def test_roundtrip_within_one_step(self, compression_ratio, bits):
+        """Verify decompress(compress(x)) is within one quantization step, odd sizes included."""
+        compressor = APHECompressor(compression_ratio=compression_ratio)
+        assert compressor.bits == bits
+        
+        # 7 * 3 = 21 elements: not a multiple of 4 (2-bit) or 2 (4-bit) codes per byte
+        grads = {"layer1": np.random.randn(7, 3).astype(np.float32), "layer2": np.linspace(-1, 1, 5)}
+        
+        restored = compressor.decompress(compressor.compress(grads))
+        
+        for name, grad in grads.items():
+            step = (grad.max() - grad.min()) / (2 ** bits - 1)
+            assert restored[name].shape == grad.shape
+            assert np.max(np.abs(restored[name] - grad)) <= step / 2 + 1e-6
+    
+    def test_constant_gradient(self):
+        """Verify a zero-range tensor round-trips to zeros."""
+        compressor = APHECompressor(compression_ratio=16)
+        restored = compressor.decompress(compressor.compress({"layer1": np.full(3, 0.5)}))
+        assert np.array_equal(restored["layer1"], np.zeros(3))
+    
+    def test_residual_accumulates_quantization_error(self):
+        """Verify residual_out gains grad - dequantized on every call."""
+        compressor = APHECompressor(compression_ratio=8)
+        grad = np.random.randn(11).astype(np.float32)
+        residual = {"layer1": np.zeros(11, dtype=np.float32)}
+        
+        payload = compressor.compress({"layer1": grad}, residual_out=residual)
+        error = grad - compressor.decompress(payload)["layer1"]
+        np.testing.assert_allclose(residual["layer1"], error, atol=1e-6)
+        
+        compressor.compress({"layer1": grad}, residual_out=residual)
+        np.testing.assert_allclose(residual["layer1"], 2 * error, atol=1e-6)
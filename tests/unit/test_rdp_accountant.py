@@ -0,0 +1,31 @@
+import math
+
+import pytest
+from tensorguard.core.privacy.rdp import DEFAULT_ORDERS, RDPAccountant
+
+
+def test_full_batch_matches_gaussian_closed_form():
+    """With q=1 the SGM is the plain Gaussian mechanism: RDP(α) = α / 2σ²."""
+    accountant = RDPAccountant()
+    accountant.step(noise_multiplier=1.0, sample_rate=1.0)
+
+    expected = min(a / 2 + math.log(1e5) / (a - 1) for a in DEFAULT_ORDERS)
+    assert accountant.get_epsilon(1e-5) == pytest.approx(expected)
+
+
+def test_matches_reference_mnist_dpsgd():
+    """q=256/60000, σ=1.1, 60 epochs, δ=1e-5 is the well-known ε≈3.01 setting."""
+    accountant = RDPAccountant(orders=list(range(2, 64)) + [128, 256])
+    accountant.step(noise_multiplier=1.1, sample_rate=256 / 60000, steps=60 * 60000 // 256)
+
+    assert accountant.get_epsilon(1e-5) == pytest.approx(3.01, abs=0.02)
+
+
+def test_epsilon_after_does_not_record():
+    accountant = RDPAccountant()
+    projected = accountant.epsilon_after(noise_multiplier=1.0, sample_rate=0.05, delta=1e-5)
+
+    assert accountant.get_epsilon(1e-5) == 0.0
+    accountant.step(noise_multiplier=1.0, sample_rate=0.05)
+    assert accountant.get_epsilon(1e-5) == pytest.approx(projected)
+    assert accountant.epsilon_after(1.0, 0.05, 1e-5) > projected
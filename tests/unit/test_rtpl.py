@@ -179,7 +179,19 @@ class TestWTFPADDefense:
         for _ in range(100):
             sample = hist.sample(rng)
             assert sample > 0
-    
+
+    def test_batch_sampling_follows_histogram(self):
+        """Verify batched draws land in bins with the histogram's frequencies."""
+        from tensorguard.agent.network.defense.wtf_pad import IATHistogram
+
+        hist = IATHistogram(bins=np.array([0.0, 0.1, 0.2, 0.3]), counts=np.array([1, 0, 3]))
+
+        samples = hist.sample_batch(np.random.default_rng(42), 10000)
+        counts, _ = np.histogram(samples, bins=hist.bins)
+
+        assert counts[1] == 0
+        assert abs(counts[2] / counts.sum() - 0.75) < 0.02
+
     @pytest.mark.skip(reason="simulate_defense removed from production WTFPAD")
     def test_simulate_defense(self):
         """Test offline simulation mode."""
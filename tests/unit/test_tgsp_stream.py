@@ -0,0 +1,85 @@
+import io
+import json
+import os
+import struct
+import tarfile
+
+from tensorguard.crypto.payload import PayloadDecryptor, PayloadEncryptor
+from tensorguard.tgsp.format import MAGIC_V1, read_tgsp_header
+
+KEY = bytes(range(32))
+M_HASH, R_HASH = "m" * 64, "r" * 64
+CHUNK = 100  # Small chunks so every read below spans several of them
+
+
+def _container(plaintext: bytes):
+    """TGSP v1.0 container bytes with plaintext encrypted in CHUNK-sized chunks."""
+    encryptor = PayloadEncryptor(KEY, M_HASH, R_HASH)
+    payload = b"".join(
+        encryptor.encrypt_chunk(plaintext[i:i + CHUNK]) for i in range(0, len(plaintext), CHUNK)
+    )
+    parts = [MAGIC_V1]
+    for block in ({"crypto": {"nonce_base": encryptor.nonce_base.hex()}}, {"files": []}, []):
+        raw = json.dumps(block).encode()
+        parts += [struct.pack(">I", len(raw)), raw]
+    sig = json.dumps({"sig": "x"}).encode()  # Trailing block the reader must not run into
+    parts += [struct.pack(">Q", len(payload)), payload, struct.pack(">I", len(sig)), sig]
+    return b"".join(parts), encryptor.nonce_base
+
+
+def _reader(container: bytes, nonce_base: bytes):
+    from tensorguard.agent.moai.orchestrator import _DecryptingReader
+
+    stream = io.BytesIO(container)
+    data = read_tgsp_header(stream)
+    stream.seek(data["payload_offset"])
+    decryptor = PayloadDecryptor(KEY, nonce_base, M_HASH, R_HASH)
+    return _DecryptingReader(stream, decryptor, data["payload_len"])
+
+
+def test_header_parses_from_bytesio():
+    container, nonce_base = _container(os.urandom(250))
+
+    data = read_tgsp_header(io.BytesIO(container))
+
+    assert data["header"]["crypto"]["nonce_base"] == nonce_base.hex()
+    assert data["recipients"] == []
+    assert data["signature_block"] == {"sig": "x"}
+    assert data["payload_len"] == 3 * (4 + 16) + 250
+
+
+def test_reader_peek_and_readinto_cross_chunks():
+    plaintext = os.urandom(5 * CHUNK + 37)
+    reader = _reader(*_container(plaintext))
+
+    # peek() pulls in several chunks without consuming them
+    assert reader.peek(2 * CHUNK + 50) == plaintext[:2 * CHUNK + 50]
+    assert reader.peek(10) == plaintext[:10]
+
+    out = bytearray()
+    buf = bytearray(64)  # Not a divisor of CHUNK, so reads straddle boundaries
+    while (n := reader.readinto(buf)):
+        out += buf[:n]
+
+    assert bytes(out) == plaintext
+    assert reader.readinto(buf) == 0
+
+
+def test_tar_streams_through_reader():
+    from tensorguard.agent.moai.orchestrator import SecureMemoryLoader
+    from tensorguard.moai.modelpack import ModelPack, ModelPackMetadata
+
+    meta = ModelPackMetadata("m-1", "1.0.0", "pi0", ["policy_head"], "2025-01-01T00:00:00", "abc123", {})
+    pack = ModelPack(meta=meta, weights={"w": os.urandom(3 * CHUNK)})
+    data = pack.serialize_flat()
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+        info = tarfile.TarInfo("model_pack.msgpack")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+
+    reader = _reader(*_container(archive.getvalue()))
+    loaded = SecureMemoryLoader.load_from_tar_stream(io.BufferedReader(reader))
+
+    assert loaded.meta.model_id == "m-1"
+    assert bytes(loaded.weights["w"]) == pack.weights["w"]
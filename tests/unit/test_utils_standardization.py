@@ -15,6 +15,14 @@ def test_atomic_write(tmp_path):
     assert target.exists()
     assert json.loads(target.read_text()) == data
 
+def test_atomic_write_bytes_replaces_existing(tmp_path):
+    target = tmp_path / "test.json"
+    target.write_text("stale")
+    atomic_write(target, b'{"key": "fresh"}')
+    
+    assert json.loads(target.read_bytes()) == {"key": "fresh"}
+    assert list(tmp_path.glob("*.tmp")) == []
+
 def test_sanitize_path():
     assert sanitize_path("../../etc/passwd") == Path("passwd")
     assert sanitize_path("safe.json", "/tmp") == Path("/tmp/safe.json")